@@ -3,7 +3,8 @@ Hunting API routes
 Endpoints for hunting data, recommendations, and regulations
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime
@@ -15,8 +16,10 @@ from app.services.modern_ai_service import ModernHuntingAI
 
 router = APIRouter(prefix="/api/hunting", tags=["hunting"])
 
-# Initialize modern AI service (Llama 3.1 via Ollama)
-ai_service = ModernHuntingAI()
+# Modern AI service (Llama 3.1 via Ollama), shared via app.state
+def get_ai_service(request: Request) -> ModernHuntingAI:
+    """Process-wide AI service created by the app lifespan"""
+    return request.app.state.ai
 
 @router.get("/wmus")
 async def get_wmus(db: Session = Depends(get_db)):
@@ -149,7 +152,8 @@ async def get_ai_recommendation(
     species: str,
     weather_data: dict,
     user_preferences: Optional[dict] = None,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    ai_service: ModernHuntingAI = Depends(get_ai_service)
 ):
     """Get AI-powered hunting recommendation"""
     try:
@@ -163,6 +167,25 @@ async def get_ai_recommendation(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to generate recommendation: {str(e)}")
 
+@router.post("/recommendations/stream")
+async def stream_ai_recommendation(
+    location: str,
+    species: str,
+    weather_data: dict,
+    user_preferences: Optional[dict] = None,
+    ai_service: ModernHuntingAI = Depends(get_ai_service)
+):
+    """Stream an AI-powered hunting recommendation as it is generated"""
+    return StreamingResponse(
+        ai_service.stream_hunting_recommendation(
+            location=location,
+            species=species,
+            weather_data=weather_data,
+            user_preferences=user_preferences
+        ),
+        media_type="text/plain; charset=utf-8"
+    )
+
 @router.get("/colebrook-info")
 async def get_colebrook_specific_info():
     """Get Colebrook, NH specific hunting information"""
@@ -205,7 +228,11 @@ async def get_colebrook_specific_info():
     }
 
 @router.get("/weather-impact/{species}")
-async def get_weather_impact(species: str, weather_data: dict):
+async def get_weather_impact(
+    species: str,
+    weather_data: dict,
+    ai_service: ModernHuntingAI = Depends(get_ai_service)
+):
     """Analyze weather impact on hunting for specific species"""
     try:
         analysis = await ai_service.analyze_weather_impact(weather_data, species)
@@ -214,7 +241,11 @@ async def get_weather_impact(species: str, weather_data: dict):
         raise HTTPException(status_code=500, detail=f"Failed to analyze weather impact: {str(e)}")
 
 @router.get("/species-advice/{species}")
-async def get_species_advice(species: str, location: str = "Colebrook, NH"):
+async def get_species_advice(
+    species: str,
+    location: str = "Colebrook, NH",
+    ai_service: ModernHuntingAI = Depends(get_ai_service)
+):
     """Get species-specific hunting advice"""
     try:
         advice = await ai_service.get_species_specific_advice(species, location)
@@ -3,6 +3,7 @@ BigMoeHunter - New Hampshire Hunting App
 Main FastAPI application entry point
 """
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -10,16 +11,26 @@ import uvicorn
 from dotenv import load_dotenv
 import os
 
+from app.services.modern_ai_service import ModernHuntingAI
+
 # Load environment variables
 load_dotenv()
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Share one AI service, and its pooled HTTP connections, across all requests"""
+    app.state.ai = ModernHuntingAI()
+    yield
+    await app.state.ai.aclose()
+
 # Create FastAPI app
 app = FastAPI(
     title="BigMoeHunter API",
     description="New Hampshire Hunting App API - Comprehensive hunting resource for NH hunters",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # CORS middleware for mobile app
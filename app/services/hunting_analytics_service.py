@@ -10,12 +10,30 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 import random
 
+# Weekday names indexed by date.weekday(), avoids locale-dependent strftime("%A")
+_WEEKDAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+# Fixed sequences for the simulated draws, indexed with random.randrange
+_MOON_PHASE_KEYS = ("new_moon", "waxing_crescent", "first_quarter", "waxing_gibbous",
+                    "full_moon", "waning_gibbous", "last_quarter", "waning_crescent")
+_MOON_PHASE_NAMES = ("New Moon", "Waxing Crescent", "First Quarter", "Waxing Gibbous",
+                     "Full Moon", "Waning Gibbous", "Last Quarter", "Waning Crescent")
+_CONDITIONS = ("Clear", "Partly Cloudy", "Overcast", "Light Rain")
+
 class HuntingAnalytics:
     """Advanced hunting analytics and prediction service"""
     
+    __slots__ = ("weather_api_key", "hunting_data", "_harvest_rates", "_pop_density", "_peak_periods")
+    
     def __init__(self):
         self.weather_api_key = None  # Would be set in production
         self.hunting_data = self._initialize_analytics_data()
+        
+        # Direct references to the Colebrook tables used on every analysis
+        colebrook_data = self.hunting_data["colebrook_specific_data"]
+        self._harvest_rates = colebrook_data["harvest_rates"]
+        self._pop_density = colebrook_data["population_densities"]
+        self._peak_periods = colebrook_data["peak_activity_periods"]
     
     def _initialize_analytics_data(self) -> Dict:
         """Initialize analytics data"""
@@ -103,7 +121,7 @@ class HuntingAnalytics:
         """Analyze current hunting conditions and predict success probability"""
         
         # Get base success rate for species
-        base_success_rate = self.hunting_data["colebrook_specific_data"]["harvest_rates"].get(species, 0.20)
+        base_success_rate = self._harvest_rates.get(species, 0.20)
         
         # Analyze weather impact
         weather_score = self._calculate_weather_score(weather_data)
@@ -138,7 +156,7 @@ class HuntingAnalytics:
             },
             "time_analysis": {
                 "score": time_score,
-                "optimal_times": self.hunting_data["colebrook_specific_data"]["peak_activity_periods"].get(species, [])
+                "optimal_times": self._peak_periods.get(species, [])
             },
             "moon_analysis": {
                 "score": moon_score,
@@ -147,7 +165,7 @@ class HuntingAnalytics:
             },
             "location_analysis": {
                 "score": location_score,
-                "population_density": self.hunting_data["colebrook_specific_data"]["population_densities"].get(species, 0)
+                "population_density": self._pop_density.get(species, 0)
             },
             "recommendations": recommendations,
             "risk_factors": self._identify_risk_factors(weather_data, species),
@@ -212,12 +230,8 @@ class HuntingAnalytics:
     
     def _calculate_moon_score(self) -> float:
         """Calculate moon phase score"""
-        # Simplified moon phase calculation
-        moon_phases = ["new_moon", "waxing_crescent", "first_quarter", "waxing_gibbous", 
-                      "full_moon", "waning_gibbous", "last_quarter", "waning_crescent"]
-        
         # For demo, return a random but realistic score
-        current_phase = random.choice(moon_phases)
+        current_phase = _MOON_PHASE_KEYS[random.randrange(8)]
         
         phase_scores = {
             "new_moon": 0.9,
@@ -314,9 +328,7 @@ class HuntingAnalytics:
     
     def _get_current_moon_phase(self) -> str:
         """Get current moon phase"""
-        phases = ["New Moon", "Waxing Crescent", "First Quarter", "Waxing Gibbous",
-                 "Full Moon", "Waning Gibbous", "Last Quarter", "Waning Crescent"]
-        return random.choice(phases)  # Simplified for demo
+        return _MOON_PHASE_NAMES[random.randrange(8)]  # Simplified for demo
     
     def _generate_recommendations(self, species: str, weather_data: Dict, 
                                 success_probability: float) -> List[str]:
@@ -412,15 +424,16 @@ class HuntingAnalytics:
     def get_hunting_forecast(self, days_ahead: int = 7) -> Dict:
         """Get hunting forecast for next N days"""
         forecast = []
+        today = datetime.now()
         
         for i in range(days_ahead):
-            date = datetime.now() + timedelta(days=i)
+            date = today + timedelta(days=i)
             
             # Simulate weather data (in production, this would come from weather API)
             weather = {
                 "temperature": random.randint(25, 65),
                 "wind_speed": random.randint(5, 20),
-                "condition": random.choice(["Clear", "Partly Cloudy", "Overcast", "Light Rain"]),
+                "condition": _CONDITIONS[random.randrange(4)],
                 "pressure": round(random.uniform(29.8, 30.3), 2)
             }
             
@@ -435,8 +448,8 @@ class HuntingAnalytics:
                 }
             
             forecast.append({
-                "date": date.strftime("%Y-%m-%d"),
-                "day_of_week": date.strftime("%A"),
+                "date": f"{date.year:04d}-{date.month:02d}-{date.day:02d}",
+                "day_of_week": _WEEKDAY_NAMES[date.weekday()],
                 "weather": weather,
                 "species_analysis": species_analysis,
                 "overall_rating": self._calculate_overall_rating(species_analysis)
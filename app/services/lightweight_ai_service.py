@@ -4,15 +4,182 @@ Uses pure Python rule-based system for hunting recommendations
 """
 
 import json
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
-import random
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+# Comprehensive hunting knowledge base, built once at import
+_HUNTING_KB = {
+    "species": {
+        "White-tailed Deer": {
+            "rut_timing": "Late October to early December",
+            "feeding_patterns": "Dawn and dusk, especially 30 minutes before sunrise and after sunset",
+            "habitat_preferences": "Mixed forests, agricultural edges, apple orchards",
+            "weather_impact": "Cool temperatures increase activity, high winds reduce movement",
+            "colebrook_tips": "Focus on Connecticut Lakes region, use apple orchards, look for fresh scrapes",
+            "equipment": "Rifle, shotgun, or bow. Use scent control products.",
+            "strategies": "Still hunting, stand hunting, calling during rut",
+            "optimal_times": "Early morning (5:30-8:00 AM) and late afternoon (4:00-6:30 PM)"
+        },
+        "Moose": {
+            "rut_timing": "Late September to early October",
+            "feeding_patterns": "Early morning and evening, active near water",
+            "habitat_preferences": "Wetlands, boreal forests, young forest stands",
+            "weather_impact": "Cool, overcast days are best. Avoid hot, sunny days.",
+            "colebrook_tips": "WMU A and B have highest success rates, focus on water sources",
+            "equipment": "Rifle (.30 caliber minimum), binoculars, GPS",
+            "strategies": "Spot and stalk, calling during rut, glassing open areas",
+            "optimal_times": "Early morning (6:00-9:00 AM) and evening (4:00-7:00 PM)"
+        },
+        "Black Bear": {
+            "rut_timing": "June to July",
+            "feeding_patterns": "Active throughout day, especially near food sources",
+            "habitat_preferences": "Dense forests, berry patches, agricultural areas",
+            "weather_impact": "Moderate temperatures ideal, avoid extreme heat",
+            "colebrook_tips": "Focus on Dixville Notch area, look for berry patches",
+            "equipment": "Rifle (.30 caliber), bear spray, bait where legal",
+            "strategies": "Baiting, spot and stalk, calling",
+            "optimal_times": "Early morning (6:00-10:00 AM) and late afternoon (3:00-7:00 PM)"
+        },
+        "Wild Turkey": {
+            "rut_timing": "Spring (April-May)",
+            "feeding_patterns": "Early morning feeding, roosting in trees",
+            "habitat_preferences": "Mixed forests, fields, agricultural areas",
+            "weather_impact": "Calm, clear mornings are best. Avoid windy conditions.",
+            "colebrook_tips": "Use calls near roosting areas, decoys can be effective",
+            "equipment": "Shotgun (12 or 20 gauge), turkey calls, decoys",
+            "strategies": "Calling, decoying, roost hunting",
+            "optimal_times": "Early morning (5:00-8:00 AM) and late afternoon (4:00-6:00 PM)"
+        }
+    },
+    "weather_patterns": {
+        "temperature": {
+            "cold": "Increases animal activity, especially deer and moose",
+            "hot": "Reduces daytime activity, animals seek shade and water",
+            "moderate": "Optimal conditions for most species"
+        },
+        "wind": {
+            "calm": "Perfect for still hunting and calling",
+            "light": "Good for scent control and movement",
+            "strong": "Difficult conditions, reduces animal movement"
+        },
+        "pressure": {
+            "rising": "Often increases animal activity",
+            "falling": "May reduce activity, storm approaching",
+            "stable": "Normal activity patterns"
+        }
+    },
+    "colebrook_locations": {
+        "Connecticut Lakes": "Prime moose and deer hunting, remote area",
+        "Dixville Notch": "Excellent deer and bear hunting, challenging terrain",
+        "Colebrook State Forest": "Local public hunting, easier access",
+        "Pittsburg": "Remote hunting opportunities, high success rates"
+    }
+}
+
+# Hunting season by calendar month, indexed month - 1
+_MONTH_TO_SEASON = ("Winter", "Winter", "Winter", "Spring", "Spring", "Summer",
+                    "Summer", "Summer", "Fall", "Fall", "Fall", "Fall")
+
+_MOON_PHASES = ("New Moon", "Waxing Crescent", "First Quarter", "Waxing Gibbous",
+                "Full Moon", "Waning Gibbous", "Last Quarter", "Waning Crescent")
+_SYNODIC_MONTH = 29.530588853
+# Proleptic ordinal day of the 2000-01-06 18:14 UTC new moon
+_NEW_MOON_EPOCH = 730125.76
+
+# Fixed recommendation sections, joined once at import
+_DEFAULT_TIMES_BLOCK = "\n".join((
+    "⏰ **Optimal Hunting Times:**",
+    "• Early morning (5:30-8:00 AM) - Peak activity period",
+    "• Late afternoon (4:00-6:30 PM) - Secondary activity window"
+))
+
+_COLEBROOK_BLOCK = "\n".join((
+    "🗺️ **Colebrook Area Tips:**",
+    "• Focus on WMU A and B for moose hunting",
+    "• Connecticut Lakes region offers excellent deer hunting",
+    "• Dixville Notch is prime for bear hunting",
+    "• Early morning hunts are most successful in this region"
+))
+
+_SAFETY_BLOCK = "\n".join((
+    "⚠️ **Safety Reminders:**",
+    "• Always wear blaze orange during firearms season",
+    "• Inform someone of your hunting location",
+    "• Check weather conditions before heading out",
+    "• Carry emergency communication device"
+))
+
+# Weather messages indexed by how many band edges a reading clears,
+# e.g. temperature: 0 = below 40°F, 1 = 40-70°F, 2 = above 70°F
+_TEMP_LINES = (
+    "• Cool temperature ({temp}°F) is excellent for animal activity",
+    "• Moderate temperature ({temp}°F) provides good hunting conditions",
+    "• Warm temperature ({temp}°F) may reduce daytime activity"
+)
+_WIND_LINES = (
+    "\n• Calm winds are perfect for still hunting and calling",
+    "\n• Light winds are good for scent control",
+    "\n• Strong winds may reduce animal movement"
+)
+_PRESSURE_LINES = (
+    "\n• Falling pressure may reduce activity",
+    "",
+    "\n• Rising barometric pressure indicates increased activity"
+)
+
+# analyze_weather_impact recommendations, same indexing; None adds nothing
+_WIND_IMPACT = ("Calm conditions are perfect for still hunting", None, "High winds may reduce animal movement")
+_TEMP_IMPACT = ("Cold weather increases animal activity", None, "Hot weather may reduce daytime activity")
+_PRESSURE_IMPACT = ("Falling pressure may reduce activity", None, "Rising pressure indicates good hunting conditions")
+
+
+def _build_species_blocks(knowledge: Dict) -> Tuple[str, ...]:
+    """Render the optimal-times and species-tips sections for one species"""
+    if knowledge.get("optimal_times"):
+        times_block = f"⏰ **Optimal Hunting Times:**\n• {knowledge['optimal_times']}"
+    else:
+        times_block = _DEFAULT_TIMES_BLOCK
+    
+    if not knowledge:
+        return (times_block,)
+    
+    tips_block = "\n".join(line for line in (
+        "🦌 **Species-Specific Tips:**",
+        f"• {knowledge['colebrook_tips']}" if "colebrook_tips" in knowledge else None,
+        f"• Recommended strategies: {knowledge['strategies']}" if "strategies" in knowledge else None,
+        f"• Equipment: {knowledge['equipment']}" if "equipment" in knowledge else None
+    ) if line)
+    return (times_block, tips_block)
+
+
+# Species -> prerendered (times, tips) blocks from the static knowledge base
+_SPECIES_BLOCKS = {
+    species: _build_species_blocks(knowledge)
+    for species, knowledge in _HUNTING_KB["species"].items()
+}
+_UNKNOWN_SPECIES_BLOCKS = _build_species_blocks({})
+
+
+# (epoch second, now, now + 6h) as ISO strings, refreshed once per second
+_stamp_cache = (0, "", "")
+
+
+def _now_stamps() -> Tuple[str, str]:
+    """Return the current and expiry ISO timestamps at second resolution"""
+    global _stamp_cache
+    now = int(time.time())
+    if now != _stamp_cache[0]:
+        current = datetime.fromtimestamp(now)
+        _stamp_cache = (now, current.isoformat(), (current + timedelta(hours=6)).isoformat())
+    return _stamp_cache[1], _stamp_cache[2]
+
 
 class LightweightHuntingAI:
     """Ultra-lightweight AI service - no external dependencies"""
     
     def __init__(self):
-        self.hunting_knowledge = self._initialize_hunting_knowledge()
+        self.hunting_knowledge = _HUNTING_KB
     
     async def get_hunting_recommendation(
         self,
@@ -29,163 +196,40 @@ class LightweightHuntingAI:
         recommendation = self._parse_recommendation(recommendation_text, context)
         return recommendation
     
-    def _initialize_hunting_knowledge(self) -> Dict:
-        """Initialize comprehensive hunting knowledge base"""
-        return {
-            "species": {
-                "White-tailed Deer": {
-                    "rut_timing": "Late October to early December",
-                    "feeding_patterns": "Dawn and dusk, especially 30 minutes before sunrise and after sunset",
-                    "habitat_preferences": "Mixed forests, agricultural edges, apple orchards",
-                    "weather_impact": "Cool temperatures increase activity, high winds reduce movement",
-                    "colebrook_tips": "Focus on Connecticut Lakes region, use apple orchards, look for fresh scrapes",
-                    "equipment": "Rifle, shotgun, or bow. Use scent control products.",
-                    "strategies": "Still hunting, stand hunting, calling during rut",
-                    "optimal_times": "Early morning (5:30-8:00 AM) and late afternoon (4:00-6:30 PM)"
-                },
-                "Moose": {
-                    "rut_timing": "Late September to early October",
-                    "feeding_patterns": "Early morning and evening, active near water",
-                    "habitat_preferences": "Wetlands, boreal forests, young forest stands",
-                    "weather_impact": "Cool, overcast days are best. Avoid hot, sunny days.",
-                    "colebrook_tips": "WMU A and B have highest success rates, focus on water sources",
-                    "equipment": "Rifle (.30 caliber minimum), binoculars, GPS",
-                    "strategies": "Spot and stalk, calling during rut, glassing open areas",
-                    "optimal_times": "Early morning (6:00-9:00 AM) and evening (4:00-7:00 PM)"
-                },
-                "Black Bear": {
-                    "rut_timing": "June to July",
-                    "feeding_patterns": "Active throughout day, especially near food sources",
-                    "habitat_preferences": "Dense forests, berry patches, agricultural areas",
-                    "weather_impact": "Moderate temperatures ideal, avoid extreme heat",
-                    "colebrook_tips": "Focus on Dixville Notch area, look for berry patches",
-                    "equipment": "Rifle (.30 caliber), bear spray, bait where legal",
-                    "strategies": "Baiting, spot and stalk, calling",
-                    "optimal_times": "Early morning (6:00-10:00 AM) and late afternoon (3:00-7:00 PM)"
-                },
-                "Wild Turkey": {
-                    "rut_timing": "Spring (April-May)",
-                    "feeding_patterns": "Early morning feeding, roosting in trees",
-                    "habitat_preferences": "Mixed forests, fields, agricultural areas",
-                    "weather_impact": "Calm, clear mornings are best. Avoid windy conditions.",
-                    "colebrook_tips": "Use calls near roosting areas, decoys can be effective",
-                    "equipment": "Shotgun (12 or 20 gauge), turkey calls, decoys",
-                    "strategies": "Calling, decoying, roost hunting",
-                    "optimal_times": "Early morning (5:00-8:00 AM) and late afternoon (4:00-6:00 PM)"
-                }
-            },
-            "weather_patterns": {
-                "temperature": {
-                    "cold": "Increases animal activity, especially deer and moose",
-                    "hot": "Reduces daytime activity, animals seek shade and water",
-                    "moderate": "Optimal conditions for most species"
-                },
-                "wind": {
-                    "calm": "Perfect for still hunting and calling",
-                    "light": "Good for scent control and movement",
-                    "strong": "Difficult conditions, reduces animal movement"
-                },
-                "pressure": {
-                    "rising": "Often increases animal activity",
-                    "falling": "May reduce activity, storm approaching",
-                    "stable": "Normal activity patterns"
-                }
-            },
-            "colebrook_locations": {
-                "Connecticut Lakes": "Prime moose and deer hunting, remote area",
-                "Dixville Notch": "Excellent deer and bear hunting, challenging terrain",
-                "Colebrook State Forest": "Local public hunting, easier access",
-                "Pittsburg": "Remote hunting opportunities, high success rates"
-            }
-        }
-    
     def _generate_recommendation(self, context: Dict) -> str:
         """Generate comprehensive hunting recommendation"""
         species = context.get("species", "White-tailed Deer")
         location = context.get("location", "Colebrook, NH")
         weather = context.get("weather", {})
         
-        knowledge = self.hunting_knowledge["species"].get(species, {})
-        
-        # Build recommendation
-        recommendation_parts = []
-        
-        # Introduction
-        recommendation_parts.append(f"🎯 **Hunting Recommendation for {species} in {location}**")
-        recommendation_parts.append("")
-        
         # Weather analysis
         temp = weather.get("temperature", 50)
         wind_speed = weather.get("wind_speed", 5)
         pressure = weather.get("barometric_pressure", 30.0)
         
-        recommendation_parts.append("🌤️ **Weather Analysis:**")
-        if temp < 40:
-            recommendation_parts.append(f"• Cool temperature ({temp}°F) is excellent for animal activity")
-        elif temp > 70:
-            recommendation_parts.append(f"• Warm temperature ({temp}°F) may reduce daytime activity")
-        else:
-            recommendation_parts.append(f"• Moderate temperature ({temp}°F) provides good hunting conditions")
-        
-        if wind_speed < 5:
-            recommendation_parts.append("• Calm winds are perfect for still hunting and calling")
-        elif wind_speed < 15:
-            recommendation_parts.append("• Light winds are good for scent control")
-        else:
-            recommendation_parts.append("• Strong winds may reduce animal movement")
-        
-        if pressure > 30.2:
-            recommendation_parts.append("• Rising barometric pressure indicates increased activity")
-        elif pressure < 29.8:
-            recommendation_parts.append("• Falling pressure may reduce activity")
-        
-        # Optimal times
-        recommendation_parts.append("")
-        recommendation_parts.append("⏰ **Optimal Hunting Times:**")
-        if knowledge.get("optimal_times"):
-            recommendation_parts.append(f"• {knowledge['optimal_times']}")
-        else:
-            recommendation_parts.append("• Early morning (5:30-8:00 AM) - Peak activity period")
-            recommendation_parts.append("• Late afternoon (4:00-6:30 PM) - Secondary activity window")
-        
-        # Species-specific advice
-        if knowledge:
-            recommendation_parts.append("")
-            recommendation_parts.append("🦌 **Species-Specific Tips:**")
-            if "colebrook_tips" in knowledge:
-                recommendation_parts.append(f"• {knowledge['colebrook_tips']}")
-            if "strategies" in knowledge:
-                recommendation_parts.append(f"• Recommended strategies: {knowledge['strategies']}")
-            if "equipment" in knowledge:
-                recommendation_parts.append(f"• Equipment: {knowledge['equipment']}")
+        temp_line = _TEMP_LINES[(temp >= 40) + (temp > 70)].format(temp=temp)
+        wind_line = _WIND_LINES[(wind_speed >= 5) + (wind_speed >= 15)]
+        pressure_line = _PRESSURE_LINES[(pressure >= 29.8) + (pressure > 30.2)]
         
-        # Colebrook-specific advice
-        recommendation_parts.append("")
-        recommendation_parts.append("🗺️ **Colebrook Area Tips:**")
-        recommendation_parts.append("• Focus on WMU A and B for moose hunting")
-        recommendation_parts.append("• Connecticut Lakes region offers excellent deer hunting")
-        recommendation_parts.append("• Dixville Notch is prime for bear hunting")
-        recommendation_parts.append("• Early morning hunts are most successful in this region")
+        blocks = [
+            f"🎯 **Hunting Recommendation for {species} in {location}**",
+            f"🌤️ **Weather Analysis:**\n{temp_line}{wind_line}{pressure_line}"
+        ]
         
-        # Safety reminders
-        recommendation_parts.append("")
-        recommendation_parts.append("⚠️ **Safety Reminders:**")
-        recommendation_parts.append("• Always wear blaze orange during firearms season")
-        recommendation_parts.append("• Inform someone of your hunting location")
-        recommendation_parts.append("• Check weather conditions before heading out")
-        recommendation_parts.append("• Carry emergency communication device")
+        # Optimal times and species-specific advice
+        blocks += _SPECIES_BLOCKS.get(species, _UNKNOWN_SPECIES_BLOCKS)
         
         # Additional tips based on conditions
-        recommendation_parts.append("")
-        recommendation_parts.append("💡 **Additional Tips:**")
-        if temp < 30:
-            recommendation_parts.append("• Dress warmly - cold weather increases animal activity")
-        if wind_speed > 15:
-            recommendation_parts.append("• Consider hunting from a stand due to windy conditions")
-        if pressure > 30.2:
-            recommendation_parts.append("• Rising pressure suggests excellent hunting conditions")
+        blocks += (
+            _COLEBROOK_BLOCK,
+            _SAFETY_BLOCK,
+            "💡 **Additional Tips:**"
+            + ("\n• Dress warmly - cold weather increases animal activity" if temp < 30 else "")
+            + ("\n• Consider hunting from a stand due to windy conditions" if wind_speed > 15 else "")
+            + ("\n• Rising pressure suggests excellent hunting conditions" if pressure > 30.2 else "")
+        )
         
-        return "\n".join(recommendation_parts)
+        return "\n\n".join(blocks)
     
     def _build_context(self, location: str, species: str, weather_data: Dict, user_preferences: Optional[Dict]) -> Dict:
         """Build context dictionary for analysis"""
@@ -193,7 +237,7 @@ class LightweightHuntingAI:
             "location": location,
             "species": species,
             "weather": weather_data,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_stamps()[0],
             "season": self._get_current_season(),
             "moon_phase": self._get_moon_phase(),
             "user_preferences": user_preferences or {}
@@ -201,6 +245,7 @@ class LightweightHuntingAI:
     
     def _parse_recommendation(self, recommendation_text: str, context: Dict) -> Dict:
         """Parse recommendation into structured format"""
+        generated_at, expires_at = _now_stamps()
         return {
             "recommendation": recommendation_text,
             "confidence_score": self._calculate_confidence(context),
@@ -212,42 +257,29 @@ class LightweightHuntingAI:
                 "Moon phase",
                 "Historical success rates"
             ],
-            "generated_at": datetime.now().isoformat(),
-            "expires_at": (datetime.now() + timedelta(hours=6)).isoformat(),
+            "generated_at": generated_at,
+            "expires_at": expires_at,
             "ai_model": "Lightweight Rule-Based System"
         }
     
     def _calculate_confidence(self, context: Dict) -> float:
         """Calculate confidence score"""
-        confidence = 0.75  # Base confidence for rule-based system
-        
-        # Increase confidence based on data completeness
-        if context.get("weather"):
-            confidence += 0.1
-        if context.get("species"):
-            confidence += 0.1
-        if context.get("location"):
-            confidence += 0.05
+        # Base confidence for rule-based system, raised by data completeness
+        confidence = (0.75
+                      + 0.1 * bool(context.get("weather"))
+                      + 0.1 * bool(context.get("species"))
+                      + 0.05 * bool(context.get("location")))
         
         return min(confidence, 0.9)  # Cap at 90%
     
     def _get_current_season(self) -> str:
         """Determine current hunting season"""
-        month = datetime.now().month
-        if month in [9, 10, 11, 12]:
-            return "Fall"
-        elif month in [1, 2, 3]:
-            return "Winter"
-        elif month in [4, 5]:
-            return "Spring"
-        else:
-            return "Summer"
+        return _MONTH_TO_SEASON[datetime.now().month - 1]
     
     def _get_moon_phase(self) -> str:
-        """Get current moon phase (simplified)"""
-        phases = ["New Moon", "Waxing Crescent", "First Quarter", "Waxing Gibbous", 
-                 "Full Moon", "Waning Gibbous", "Last Quarter", "Waning Crescent"]
-        return random.choice(phases)
+        """Get current moon phase from the mean synodic month"""
+        age = (datetime.now(timezone.utc).toordinal() - _NEW_MOON_EPOCH) % _SYNODIC_MONTH
+        return _MOON_PHASES[int(age / _SYNODIC_MONTH * 8 + 0.5) % 8]
     
     async def get_species_specific_advice(self, species: str, location: str) -> Dict:
         """Get species-specific hunting advice"""
@@ -272,23 +304,14 @@ class LightweightHuntingAI:
             "temperature_impact": "Cooler temperatures increase animal activity",
             "pressure_impact": "Rising barometric pressure often increases activity",
             "precipitation_impact": "Light rain can be good for tracking",
-            "recommendations": []
+            # Specific recommendations for readings outside the neutral band
+            "recommendations": [
+                message for message in (
+                    _WIND_IMPACT[(wind_speed >= 3) + (wind_speed > 20)],
+                    _TEMP_IMPACT[(temp >= 30) + (temp > 70)],
+                    _PRESSURE_IMPACT[(pressure >= 29.8) + (pressure > 30.2)]
+                ) if message
+            ]
         }
         
-        # Add specific recommendations
-        if wind_speed > 20:
-            analysis["recommendations"].append("High winds may reduce animal movement")
-        elif wind_speed < 3:
-            analysis["recommendations"].append("Calm conditions are perfect for still hunting")
-        
-        if temp > 70:
-            analysis["recommendations"].append("Hot weather may reduce daytime activity")
-        elif temp < 30:
-            analysis["recommendations"].append("Cold weather increases animal activity")
-        
-        if pressure > 30.2:
-            analysis["recommendations"].append("Rising pressure indicates good hunting conditions")
-        elif pressure < 29.8:
-            analysis["recommendations"].append("Falling pressure may reduce activity")
-        
         return analysis
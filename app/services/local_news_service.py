@@ -4,20 +4,169 @@ Local News Integration Service for BigMoeHunter
 Integrates local New Hampshire newspapers and news sources
 """
 
+import asyncio
+import heapq
 import requests
+import httpx
+import io
 import json
-import feedparser
+import re
+import xml.etree.ElementTree as ElementTree
+from collections import OrderedDict, defaultdict
+from email.utils import parsedate_to_datetime
+from operator import itemgetter
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from itertools import islice
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
 import time
 
+# feedparser is only needed to salvage feeds that are not well-formed XML
+try:
+    import feedparser
+    FEEDPARSER_AVAILABLE = True
+except ImportError:
+    FEEDPARSER_AVAILABLE = False
+
+# Keyword groups used for relevance filtering and scoring
+_HUNTING_KEYWORDS = (
+    'hunting', 'deer', 'moose', 'bear', 'turkey', 'fishing', 'outdoor',
+    'wildlife', 'game', 'season', 'license', 'permit', 'forest', 'woods'
+)
+
+_LOCAL_KEYWORDS = (
+    'colebrook', 'coos county', 'berlin', 'lancaster', 'pittsburg',
+    'dixville notch', 'connecticut lakes', 'new hampshire', 'nh'
+)
+
+_COLEBROOK_KEYWORDS = (
+    'colebrook', 'coos county', 'berlin', 'lancaster', 'pittsburg',
+    'dixville notch', 'connecticut lakes', 'wmu a', 'wmu b', 'wmu c'
+)
+
+_LOCAL_CATEGORIES = frozenset(("local_newspapers", "regional_sources"))
+
+
+def _compile_keywords(keywords) -> re.Pattern:
+    """Build a single substring alternation for lowercase text"""
+    return re.compile('|'.join(map(re.escape, keywords)))
+
+
+_HUNTING_RE = _compile_keywords(_HUNTING_KEYWORDS)
+_RELEVANT_RE = _compile_keywords(_LOCAL_KEYWORDS + _HUNTING_KEYWORDS)
+_COLEBROOK_RE = _compile_keywords(_COLEBROOK_KEYWORDS)
+
+# Per-keyword (title, summary) score weights
+_KEYWORD_WEIGHTS = {
+    **{keyword: (0.1, 0.05) for keyword in _HUNTING_KEYWORDS},
+    **{keyword: (0.15, 0.1) for keyword in _LOCAL_KEYWORDS}
+}
+
+
+def _parse_published(published: str) -> int:
+    """Convert an RFC 822 or ISO 8601 feed date to epoch seconds, 0 if unknown"""
+    try:
+        return int(parsedate_to_datetime(published).timestamp())
+    except (TypeError, ValueError, IndexError):
+        pass
+    try:
+        return int(datetime.fromisoformat(published).timestamp())
+    except (TypeError, ValueError):
+        return 0
+
+
+# RSS <item> / Atom <entry> element names, namespace stripped
+_ITEM_TAGS = frozenset(("item", "entry"))
+
+# Entry key -> candidate child element names in priority order (RSS 2.0, Atom, RSS 1.0/DC)
+_ENTRY_FIELDS = (
+    ("title", ("title",)),
+    ("link", ("link",)),
+    ("summary", ("description", "summary", "content", "encoded")),
+    ("published", ("pubDate", "published", "updated", "date"))
+)
+
+
+def _local_name(tag: str) -> str:
+    """Strip the {namespace} prefix from an element tag"""
+    return tag.rpartition('}')[2]
+
+
+def _parse_feed_entries(content: bytes) -> List[Dict]:
+    """Extract title/link/summary/published from every RSS or Atom entry"""
+    try:
+        entries = []
+        for _, elem in ElementTree.iterparse(io.BytesIO(content), events=("end",)):
+            if _local_name(elem.tag) not in _ITEM_TAGS:
+                continue
+            
+            fields = {}
+            for child in elem:
+                name = _local_name(child.tag)
+                if name == "link" and child.get("href"):
+                    # Atom carries the URL in href, prefer the alternate link
+                    if child.get("rel", "alternate") == "alternate":
+                        fields.setdefault(name, child.get("href"))
+                elif name not in fields:
+                    fields[name] = (child.text or "").strip()
+            
+            entry = {}
+            for key, names in _ENTRY_FIELDS:
+                for name in names:
+                    if name in fields:
+                        entry[key] = fields[name]
+                        break
+            entries.append(entry)
+            
+            elem.clear()
+        return entries
+    except ElementTree.ParseError:
+        if not FEEDPARSER_AVAILABLE:
+            raise
+        return feedparser.parse(content).entries
+
+
+def _trigrams(text: str) -> set:
+    """All distinct 3-character substrings of text"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+# Sort key for newest-first ordering of (published epoch, item) pairs
+_published_key = itemgetter(0)
+
+# (epoch second, isoformat) of the last formatted timestamp
+_iso_cache = (0, "")
+
+
+def _now_iso() -> str:
+    """Local ISO timestamp at second resolution, formatted once per second"""
+    global _iso_cache
+    now = int(time.time())
+    if now != _iso_cache[0]:
+        _iso_cache = (now, datetime.fromtimestamp(now).isoformat())
+    return _iso_cache[1]
+
+
 class LocalNewsService:
     """Service for integrating local news into BigMoeHunter"""
     
     def __init__(self):
         self.news_sources = self._initialize_news_sources()
-        self.cache = {}
+        # Bounded LRU of key -> (expiry timestamp, result)
+        self._cache = OrderedDict()
+        self._max_entries = 128
         self.cache_duration = 3600  # 1 hour cache
+        self.fetch_timeout = 5
+        # Cap concurrent requests per feed host so a fan-out never hammers one domain
+        self._host_semaphores = defaultdict(lambda: asyncio.Semaphore(2))
+        # Persistent keep-alive client, created on first fetch
+        self._client: Optional[httpx.AsyncClient] = None
+        # Feed url -> (ETag, Last-Modified, parsed entries) for conditional GETs
+        self._feed_state: Dict[str, Tuple[str, str, List[Dict]]] = {}
+        # Cache key -> pending fetch task shared by concurrent callers
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        # (news result, lowercased haystacks, trigram -> item positions) for search_news
+        self._search_index = (None, [], {})
     
     def _initialize_news_sources(self) -> Dict:
         """Initialize local news sources for Colebrook, NH area"""
@@ -79,38 +228,54 @@ class LocalNewsService:
             }
         }
     
-    def get_local_news(self, source_type: str = "all", limit: int = 10) -> Dict:
+    async def get_local_news(self, source_type: str = "all", limit: int = 10) -> Dict:
         """Get local news from specified sources"""
+        cache_key = ("local_news", source_type, limit)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
+        # Single-flight: concurrent misses for the same key share one upstream fetch
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(self._load_local_news(cache_key, source_type, limit))
+            self._inflight[cache_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(cache_key, None))
+        return await asyncio.shield(task)
+    
+    async def _load_local_news(self, cache_key: Hashable, source_type: str, limit: int) -> Dict:
+        """Fetch, merge and cache local news on a cache miss"""
         try:
-            cache_key = f"local_news_{source_type}_{limit}"
-            if self._is_cache_valid(cache_key):
-                return self.cache[cache_key]
-            
-            news_items = []
+            categories = []
             
             if source_type == "all" or source_type == "local":
-                news_items.extend(self._fetch_rss_news("local_newspapers", limit))
+                categories.append("local_newspapers")
             
             if source_type == "all" or source_type == "regional":
-                news_items.extend(self._fetch_rss_news("regional_sources", limit))
+                categories.append("regional_sources")
             
             if source_type == "all" or source_type == "hunting":
-                news_items.extend(self._fetch_rss_news("hunting_outdoors", limit))
+                categories.append("hunting_outdoors")
             
-            # Sort by date and limit results
-            news_items.sort(key=lambda x: x.get('published', ''), reverse=True)
-            news_items = news_items[:limit]
+            # Fetch every feed concurrently over the shared connection pool
+            results = await asyncio.gather(
+                *(self._fetch_rss_news(category, limit) for category in categories)
+            )
+            # Merge the per-feed newest-first runs, stopping once limit items are out
+            feeds = [feed_items for feed_lists in results for feed_items in feed_lists]
+            news_items = [news_item for _, news_item in islice(
+                heapq.merge(*feeds, key=_published_key, reverse=True), limit
+            )]
             
             result = {
                 "source_type": source_type,
                 "total_items": len(news_items),
-                "last_updated": datetime.now().isoformat(),
+                "last_updated": _now_iso(),
                 "news_items": news_items
             }
             
             # Cache the result
-            self.cache[cache_key] = result
-            self.cache[cache_key + "_timestamp"] = time.time()
+            self._cache_set(cache_key, result)
             
             return result
             
@@ -122,137 +287,165 @@ class LocalNewsService:
                 "news_items": []
             }
     
-    def _fetch_rss_news(self, source_category: str, limit: int) -> List[Dict]:
-        """Fetch news from RSS feeds"""
-        news_items = []
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared keep-alive HTTP client"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.fetch_timeout,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=16, max_keepalive_connections=8),
+                headers={'Accept-Encoding': 'gzip, deflate'}
+            )
+        return self._client
+    
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    async def _fetch_feed_entries(self, url: str) -> List[Dict]:
+        """Fetch and parse a feed, limited per host and revalidated via ETag/Last-Modified"""
+        etag, last_modified, entries = self._feed_state.get(url, ("", "", None))
+        headers = {}
+        if entries is not None:
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        
+        async with self._host_semaphores[urlsplit(url).netloc]:
+            response = await self._get_client().get(url, headers=headers)
+        
+        # Unchanged since the last poll, skip the download and the parse
+        if response.status_code == 304 and entries is not None:
+            return entries
+        
+        response.raise_for_status()
+        # Parsing is CPU-bound, keep it off the event loop
+        entries = await asyncio.to_thread(_parse_feed_entries, response.content)
+        etag = response.headers.get('ETag', '')
+        last_modified = response.headers.get('Last-Modified', '')
+        if etag or last_modified:
+            self._feed_state[url] = (etag, last_modified, entries)
+        return entries
+    
+    async def _fetch_rss_news(self, source_category: str, limit: int) -> List[List[Tuple[int, Dict]]]:
+        """Fetch news from RSS feeds, one newest-first list of (published epoch, item) per feed"""
+        feed_lists = []
         sources = self.news_sources.get(source_category, {})
+        feed_sources = [source_info for source_info in sources.values() if source_info.get('rss')]
+        
+        feed_entries = await asyncio.gather(
+            *(self._fetch_feed_entries(source_info['rss']) for source_info in feed_sources),
+            return_exceptions=True
+        )
         
-        for source_id, source_info in sources.items():
+        for source_info, entries in zip(feed_sources, feed_entries):
             try:
-                if source_info.get('rss'):
-                    feed = feedparser.parse(source_info['rss'])
+                if isinstance(entries, Exception):
+                    raise entries
+                
+                news_items = []
+                
+                for entry in entries[:limit]:
+                    title = entry.get('title', '').lower()
+                    summary = entry.get('summary', '').lower()
                     
-                    for entry in feed.entries[:limit]:
-                        # Filter for relevant content
-                        if self._is_relevant_content(entry, source_category):
-                            news_item = {
-                                "title": entry.get('title', 'No title'),
-                                "summary": entry.get('summary', 'No summary available'),
-                                "link": entry.get('link', ''),
-                                "published": entry.get('published', ''),
-                                "source": source_info['name'],
-                                "source_url": source_info['url'],
-                                "area": source_info['area'],
-                                "category": source_category,
-                                "relevance_score": self._calculate_relevance_score(entry, source_category)
-                            }
-                            news_items.append(news_item)
-                            
+                    # Filter for relevant content
+                    if self._is_relevant_content(title, summary, source_category):
+                        published = entry.get('published', '')
+                        news_item = {
+                            "title": entry.get('title', 'No title'),
+                            "summary": entry.get('summary', 'No summary available'),
+                            "link": entry.get('link', ''),
+                            "published": published,
+                            "source": source_info['name'],
+                            "source_url": source_info['url'],
+                            "area": source_info['area'],
+                            "category": source_category,
+                            "relevance_score": self._calculate_relevance_score(title, summary)
+                        }
+                        news_items.append((_parse_published(published), news_item))
+                
+                news_items.sort(key=_published_key, reverse=True)
+                feed_lists.append(news_items)
+                
             except Exception as e:
                 print(f"Error fetching RSS from {source_info['name']}: {e}")
                 continue
         
-        return news_items
+        return feed_lists
     
-    def _is_relevant_content(self, entry: Dict, source_category: str) -> bool:
-        """Check if content is relevant to hunting/outdoors/local news"""
-        title = entry.get('title', '').lower()
-        summary = entry.get('summary', '').lower()
-        
-        # Keywords for relevant content
-        hunting_keywords = [
-            'hunting', 'deer', 'moose', 'bear', 'turkey', 'fishing', 'outdoor',
-            'wildlife', 'game', 'season', 'license', 'permit', 'forest', 'woods'
-        ]
-        
-        local_keywords = [
-            'colebrook', 'coos county', 'berlin', 'lancaster', 'pittsburg',
-            'dixville notch', 'connecticut lakes', 'new hampshire', 'nh'
-        ]
-        
+    def _is_relevant_content(self, title: str, summary: str, source_category: str) -> bool:
+        """Check if lowercased title/summary are relevant to hunting/outdoors/local news"""
         # Check for hunting/outdoor relevance
         if source_category == "hunting_outdoors":
-            return any(keyword in title or keyword in summary for keyword in hunting_keywords)
-        
+            pattern = _HUNTING_RE
         # Check for local relevance
-        if source_category in ["local_newspapers", "regional_sources"]:
-            return any(keyword in title or keyword in summary for keyword in local_keywords + hunting_keywords)
+        elif source_category in _LOCAL_CATEGORIES:
+            pattern = _RELEVANT_RE
+        else:
+            return True  # Include all content if no specific filtering
         
-        return True  # Include all content if no specific filtering
+        return bool(pattern.search(title) or pattern.search(summary))
     
-    def _calculate_relevance_score(self, entry: Dict, source_category: str) -> float:
-        """Calculate relevance score for news item"""
-        title = entry.get('title', '').lower()
-        summary = entry.get('summary', '').lower()
-        
+    def _calculate_relevance_score(self, title: str, summary: str) -> float:
+        """Calculate relevance score from lowercased title/summary"""
         score = 0.5  # Base score
         
-        # Hunting/outdoor keywords
-        hunting_keywords = [
-            'hunting', 'deer', 'moose', 'bear', 'turkey', 'fishing', 'outdoor',
-            'wildlife', 'game', 'season', 'license', 'permit', 'forest', 'woods'
-        ]
-        
-        # Local keywords
-        local_keywords = [
-            'colebrook', 'coos county', 'berlin', 'lancaster', 'pittsburg',
-            'dixville notch', 'connecticut lakes', 'new hampshire', 'nh'
-        ]
-        
-        # Increase score for hunting keywords
-        for keyword in hunting_keywords:
-            if keyword in title:
-                score += 0.1
-            if keyword in summary:
-                score += 0.05
-        
-        # Increase score for local keywords
-        for keyword in local_keywords:
+        # Each keyword counts once per field, including keywords nested in others
+        for keyword, (title_weight, summary_weight) in _KEYWORD_WEIGHTS.items():
             if keyword in title:
-                score += 0.15
+                score += title_weight
             if keyword in summary:
-                score += 0.1
+                score += summary_weight
         
         return min(score, 1.0)
     
-    def _is_cache_valid(self, cache_key: str) -> bool:
-        """Check if cached data is still valid"""
-        timestamp_key = cache_key + "_timestamp"
-        if cache_key in self.cache and timestamp_key in self.cache:
-            return (time.time() - self.cache[timestamp_key]) < self.cache_duration
-        return False
+    def _cache_get(self, cache_key: Hashable) -> Optional[Dict]:
+        """Return a fresh cached result and mark it recently used"""
+        entry = self._cache.get(cache_key)
+        if entry is None:
+            return None
+        if entry[0] <= time.time():
+            del self._cache[cache_key]
+            return None
+        self._cache.move_to_end(cache_key)
+        return entry[1]
     
-    def get_hunting_news(self, limit: int = 5) -> Dict:
+    def _cache_set(self, cache_key: Hashable, value: Dict):
+        """Store a result, evicting the least recently used entry when full"""
+        self._cache[cache_key] = (time.time() + self.cache_duration, value)
+        self._cache.move_to_end(cache_key)
+        if len(self._cache) > self._max_entries:
+            self._cache.popitem(last=False)
+    
+    async def get_hunting_news(self, limit: int = 5) -> Dict:
         """Get hunting and outdoor specific news"""
-        return self.get_local_news("hunting", limit)
+        return await self.get_local_news("hunting", limit)
     
-    def get_colebrook_news(self, limit: int = 5) -> Dict:
+    async def get_colebrook_news(self, limit: int = 5) -> Dict:
         """Get news specifically relevant to Colebrook area"""
         try:
-            cache_key = f"colebrook_news_{limit}"
-            if self._is_cache_valid(cache_key):
-                return self.cache[cache_key]
+            cache_key = ("colebrook_news", limit)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
             
             # Get all news and filter for Colebrook relevance
-            all_news = self.get_local_news("all", limit * 2)
-            colebrook_news = []
-            
-            for item in all_news.get('news_items', []):
-                if self._is_colebrook_relevant(item):
-                    colebrook_news.append(item)
-                    if len(colebrook_news) >= limit:
-                        break
+            all_news = await self.get_local_news("all", limit * 2)
+            colebrook_news = self._filtered(all_news.get('news_items', []), self._is_colebrook_relevant, limit)
             
             result = {
                 "source_type": "colebrook",
                 "total_items": len(colebrook_news),
-                "last_updated": datetime.now().isoformat(),
+                "last_updated": _now_iso(),
                 "news_items": colebrook_news
             }
             
             # Cache the result
-            self.cache[cache_key] = result
-            self.cache[cache_key + "_timestamp"] = time.time()
+            self._cache_set(cache_key, result)
             
             return result
             
@@ -264,19 +457,33 @@ class LocalNewsService:
                 "news_items": []
             }
     
+    def _get_search_index(self, news: Dict) -> Tuple[List[str], Dict[str, List[int]]]:
+        """Lowercased haystacks and trigram postings for a news result, built once per result"""
+        if self._search_index[0] is not news:
+            haystacks = [
+                f"{item.get('title', '')}\0{item.get('summary', '')}".lower()
+                for item in news.get('news_items', [])
+            ]
+            postings = defaultdict(list)
+            for position, haystack in enumerate(haystacks):
+                for trigram in _trigrams(haystack):
+                    postings[trigram].append(position)
+            self._search_index = (news, haystacks, dict(postings))
+        return self._search_index[1], self._search_index[2]
+    
+    @staticmethod
+    def _filtered(news_items: Iterable[Dict], predicate: Callable[[Dict], bool], limit: int) -> List[Dict]:
+        """Lazily take the first limit items matching predicate"""
+        return list(islice(filter(predicate, news_items), limit))
+    
     def _is_colebrook_relevant(self, news_item: Dict) -> bool:
         """Check if news item is relevant to Colebrook area"""
         title = news_item.get('title', '').lower()
         summary = news_item.get('summary', '').lower()
         area = news_item.get('area', '').lower()
         
-        colebrook_keywords = [
-            'colebrook', 'coos county', 'berlin', 'lancaster', 'pittsburg',
-            'dixville notch', 'connecticut lakes', 'wmu a', 'wmu b', 'wmu c'
-        ]
-        
-        return any(keyword in title or keyword in summary or keyword in area 
-                  for keyword in colebrook_keywords)
+        pattern = _COLEBROOK_RE
+        return bool(pattern.search(title) or pattern.search(summary) or pattern.search(area))
     
     def get_news_sources(self) -> Dict:
         """Get available news sources"""
@@ -286,38 +493,41 @@ class LocalNewsService:
             "categories": list(self.news_sources.keys())
         }
     
-    def search_news(self, query: str, limit: int = 10) -> Dict:
+    async def search_news(self, query: str, limit: int = 10) -> Dict:
         """Search news items by query"""
         try:
-            cache_key = f"search_{query}_{limit}"
-            if self._is_cache_valid(cache_key):
-                return self.cache[cache_key]
+            cache_key = ("search", query, limit)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
             
             # Get all news and filter by query
-            all_news = self.get_local_news("all", limit * 2)
-            matching_news = []
-            
+            all_news = await self.get_local_news("all", limit * 2)
+            news_items = all_news.get('news_items', [])
+            haystacks, postings = self._get_search_index(all_news)
             query_lower = query.lower()
             
-            for item in all_news.get('news_items', []):
-                title = item.get('title', '').lower()
-                summary = item.get('summary', '').lower()
-                
-                if query_lower in title or query_lower in summary:
-                    matching_news.append(item)
-                    if len(matching_news) >= limit:
-                        break
+            # Narrow to items containing every query trigram, then confirm the substring
+            if len(query_lower) >= 3:
+                posting_lists = sorted((postings.get(trigram, ()) for trigram in _trigrams(query_lower)), key=len)
+                positions = sorted(set(posting_lists[0]).intersection(*posting_lists[1:]))
+            else:
+                positions = range(len(haystacks))
+            
+            matching_news = [
+                news_items[position] for position in
+                islice((position for position in positions if query_lower in haystacks[position]), limit)
+            ]
             
             result = {
                 "query": query,
                 "total_items": len(matching_news),
-                "last_updated": datetime.now().isoformat(),
+                "last_updated": _now_iso(),
                 "news_items": matching_news
             }
             
             # Cache the result
-            self.cache[cache_key] = result
-            self.cache[cache_key + "_timestamp"] = time.time()
+            self._cache_set(cache_key, result)
             
             return result
             
@@ -329,5 +539,10 @@ class LocalNewsService:
                 "news_items": []
             }
 
-# Global instance
-local_news_service = LocalNewsService()
+# Global instance, created on first access (PEP 562) so importing the module stays cheap
+def __getattr__(name: str):
+    if name == "local_news_service":
+        global local_news_service
+        local_news_service = LocalNewsService()
+        return local_news_service
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,45 +5,380 @@ Cutting-edge AI that runs completely locally - no API keys required
 
 import json
 import requests
+from requests.adapters import HTTPAdapter
+import httpx
 import asyncio
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional
 import subprocess
 import os
+import threading
+import math
+import time
+from collections import OrderedDict, deque
+
+# orjson parses Ollama's responses several times faster; stdlib json accepts the same bytes
+try:
+    import orjson
+    _json_loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    _json_loads = json.loads
+    ORJSON_AVAILABLE = False
+
+# (ollama_url, model_name) -> (checked_at, available), shared across instances
+_AVAILABILITY_TTL = 30.0
+_availability_cache: Dict[tuple, tuple] = {}
+# Models already asked to stay resident in Ollama
+_preloaded_models = set()
+
+# Adaptive Ollama timeouts: 2x the rolling P95 latency, clamped to these bounds
+_LATENCY_WINDOW = 50
+_MIN_LATENCY_SAMPLES = 5
+_MIN_TIMEOUT = 5.0
+_MAX_TIMEOUT = 60.0
+
+# How long Ollama keeps the model resident after each call, so consecutive requests skip the reload
+_KEEP_ALIVE = "1h"
+
+# Recommendations, and cached Llama answers, are valid for this long
+_RECOMMENDATION_TTL = timedelta(hours=6)
+
+# Ultimate fallback answer; only the text and timestamps vary per request
+_BASIC_RECOMMENDATION_TEMPLATE = {
+    "recommendation": None,
+    "confidence_score": 0.5,
+    "factors_considered": ("Basic weather", "Species", "Location"),
+    "generated_at": None,
+    "expires_at": None,
+    "ai_model": "Basic Fallback System"
+}
+
+# Hunting season indexed by calendar month (index 0 unused)
+_SEASON_BY_MONTH = (None, "Winter", "Winter", "Winter", "Spring", "Spring", "Summer",
+                    "Summer", "Summer", "Fall", "Fall", "Fall", "Fall")
+
+# Prompt templates, filled with str.format per request
+_RECOMMENDATION_PROMPT_BODY = """You are an expert hunting guide and wildlife biologist specializing in New Hampshire hunting, particularly the Colebrook region. You have decades of experience and deep knowledge of local wildlife patterns, terrain, and hunting strategies.
+
+HUNTING REQUEST:
+- Location: {location}
+- Target Species: {species}
+- Current Weather: {temp}°F, {wind_speed} mph winds, {pressure}" pressure, {humidity}% humidity
+- Season: {season}
+- Time: {time}
+
+EXPERTISE AREAS:
+- New Hampshire Fish & Game regulations
+- Wildlife Management Unit (WMU) characteristics
+- Species behavior patterns and seasonal movements
+- Weather impact on animal activity
+- Local terrain and hunting strategies
+- Safety protocols and best practices
+- Equipment recommendations
+
+Please provide a comprehensive hunting recommendation that includes:
+
+1. **WEATHER ANALYSIS**: How current conditions affect {species} behavior
+2. **OPTIMAL TIMES**: Best hunting windows for today/tomorrow
+3. **LOCATION STRATEGY**: Specific areas and tactics for {location}
+4. **EQUIPMENT ADVICE**: What gear to use and why
+5. **SAFETY CONSIDERATIONS**: Important safety reminders
+6. **SUCCESS TIPS**: Advanced strategies for this species and location
+7. **REGULATORY NOTES**: Any relevant NH hunting regulations
+
+Make your advice specific, practical, and actionable. Use your expertise to provide insights that go beyond basic information. Consider factors like:
+- Barometric pressure trends
+- Wind patterns and scent control
+- Terrain features specific to the area
+- Historical success patterns
+- Seasonal behavior changes
+
+"""
+_RECOMMENDATION_PROMPT = _RECOMMENDATION_PROMPT_BODY + (
+    "Format your response in a clear, organized manner with specific recommendations."
+)
+# JSON-mode variant: one string per numbered section, in the same order
+_RECOMMENDATION_SECTIONS = (
+    ("weather_analysis", "WEATHER ANALYSIS"),
+    ("optimal_times", "OPTIMAL TIMES"),
+    ("location_strategy", "LOCATION STRATEGY"),
+    ("equipment", "EQUIPMENT ADVICE"),
+    ("safety", "SAFETY CONSIDERATIONS"),
+    ("tips", "SUCCESS TIPS"),
+    ("regs", "REGULATORY NOTES")
+)
+_RECOMMENDATION_JSON_PROMPT = _RECOMMENDATION_PROMPT_BODY + (
+    "Respond with only a JSON object with one string value per numbered section above, under the keys "
+    + ", ".join(f'"{key}"' for key, _ in _RECOMMENDATION_SECTIONS) + "."
+)
+
+_SPECIES_ADVICE_PROMPT = """As an expert wildlife biologist specializing in {species} in {location}, provide detailed hunting advice including:
+- Behavior patterns and seasonal changes
+- Habitat preferences and movement patterns
+- Optimal hunting strategies
+- Equipment recommendations
+- Safety considerations
+- Local area specific tips
+
+Be specific and practical in your advice."""
+
+_WEATHER_IMPACT_PROMPT = """Analyze how these weather conditions affect {species} hunting:
+- Temperature: {temperature}°F
+- Wind Speed: {wind_speed} mph
+- Pressure: {pressure}"
+- Humidity: {humidity}%
+
+Provide specific insights on:
+- Animal activity patterns
+- Movement behavior changes
+- Hunting strategy adjustments
+- Optimal timing recommendations"""
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is short-circuited by an open circuit breaker"""
+
+
+class CircuitBreaker:
+    """Closed -> open -> half-open breaker guarding calls to a flaky dependency"""
+    
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0, half_open_probes: int = 1):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self.state = "closed"
+        self.failures = 0
+        self.opens_until = 0.0
+        self._probes_in_flight = 0
+    
+    def allow_request(self) -> bool:
+        """Return True if a call may go through right now"""
+        if self.state == "closed":
+            return True
+        if self.state == "open":
+            if time.monotonic() < self.opens_until:
+                return False
+            self.state = "half_open"
+            self._probes_in_flight = 0
+        # Half-open: let a limited number of probe calls test the dependency
+        if self._probes_in_flight < self.half_open_probes:
+            self._probes_in_flight += 1
+            return True
+        return False
+    
+    def record_success(self):
+        """Close the circuit after a successful call"""
+        self.state = "closed"
+        self.failures = 0
+        self._probes_in_flight = 0
+    
+    def record_failure(self):
+        """Count a failure, opening the circuit at the threshold or on a failed probe"""
+        self.failures += 1
+        if self.state == "half_open" or self.failures >= self.failure_threshold:
+            self.state = "open"
+            self.opens_until = time.monotonic() + self.reset_timeout
+            self._probes_in_flight = 0
+
 
 class ModernHuntingAI:
     """Modern AI service using Ollama with Llama 3 - completely free and local"""
     
-    def __init__(self):
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        """
+        Generation requests go through an async client so concurrent callers overlap.
+        Ollama serves them in parallel when started with OLLAMA_NUM_PARALLEL > 1;
+        OLLAMA_MAX_LOADED_MODELS bounds how many models it keeps resident.
+        """
         self.ollama_url = "http://localhost:11434"
         self.model_name = "llama3.1:8b"  # Llama 3.1 8B - modern, fast, capable
-        self.fallback_ai = None
-        self.ollama_available = self._check_ollama_availability()
+        self.breaker = CircuitBreaker(failure_threshold=5, reset_timeout=30.0, half_open_probes=1)
+        
+        # Recent successful latencies: whole response for one-shot calls, first chunk for streams
+        self.latency_windows = {
+            "generate": deque(maxlen=_LATENCY_WINDOW),
+            "stream": deque(maxlen=_LATENCY_WINDOW)
+        }
+        
+        # LRU of quantized request -> (expiry timestamp, Llama recommendation), valid as long as the response
+        self._recommendation_cache = OrderedDict()
+        self._recommendation_cache_size = 512
+        self._recommendation_ttl = _RECOMMENDATION_TTL.total_seconds()
+        
+        # Async pool for generation, shared when injected by the application
+        self.http = http_client or httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=30.0
+        )
         
-        # Initialize fallback for when Ollama isn't available
-        if not self.ollama_available:
-            from app.services.lightweight_ai_service import LightweightHuntingAI
-            self.fallback_ai = LightweightHuntingAI()
+        # Keep-alive pool for the synchronous availability probe
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"Connection": "keep-alive", "Accept-Encoding": "gzip, deflate"})
+        
+        # Warm the availability cache and preload the model
+        self._check_ollama_availability()
+        
+        # Fallback for when Ollama isn't available or its circuit is open
+        from app.services.lightweight_ai_service import LightweightHuntingAI
+        self.fallback_ai = LightweightHuntingAI()
+        
+        # Recommendation sources in preference order: (name, provider, breaker).
+        # Llama guards itself with self.breaker; the basic template is the last resort and never skipped.
+        self.providers = [
+            ("llama3", self._llama3_recommendation, None),
+            ("llama3_stale_cache", self._stale_recommendation, None),
+            ("lightweight", self.fallback_ai.get_hunting_recommendation, CircuitBreaker(failure_threshold=3, reset_timeout=60.0)),
+            ("basic", self._basic_recommendation, None)
+        ]
+    
+    async def aclose(self):
+        """Release pooled Ollama connections"""
+        await self.http.aclose()
+        self.session.close()
     
     def _check_ollama_availability(self) -> bool:
+        """Check Ollama availability, reusing a probe result younger than the TTL"""
+        key = (self.ollama_url, self.model_name)
+        now = time.monotonic()
+        cached = _availability_cache.get(key)
+        if cached is not None and now - cached[0] < _AVAILABILITY_TTL:
+            return cached[1]
+        
+        available = self._probe_ollama()
+        _availability_cache[key] = (now, available)
+        
+        # Load the model ahead of the first real request
+        if available and key not in _preloaded_models:
+            _preloaded_models.add(key)
+            threading.Thread(target=self._preload_model, daemon=True).start()
+        return available
+    
+    @property
+    def ollama_available(self) -> bool:
+        """Current Ollama availability, re-probed once the cached result is older than the TTL"""
+        return self._check_ollama_availability()
+    
+    @ollama_available.setter
+    def ollama_available(self, available: bool):
+        _availability_cache[(self.ollama_url, self.model_name)] = (time.monotonic(), available)
+    
+    async def _is_ollama_available(self) -> bool:
+        """Async availability check that runs a stale probe off the event loop"""
+        cached = _availability_cache.get((self.ollama_url, self.model_name))
+        if cached is not None and time.monotonic() - cached[0] < _AVAILABILITY_TTL:
+            return cached[1]
+        return await asyncio.to_thread(self._check_ollama_availability)
+    
+    def _preload_model(self):
+        """Ask Ollama to load the model and keep it resident for an hour"""
+        try:
+            self.session.post(
+                f"{self.ollama_url}/api/generate",
+                json={"model": self.model_name, "keep_alive": _KEEP_ALIVE},
+                timeout=300
+            )
+        except requests.RequestException:
+            pass
+    
+    def _probe_ollama(self) -> bool:
         """Check if Ollama is running and has the model"""
         try:
-            response = requests.get(f"{self.ollama_url}/api/tags", timeout=5)
+            response = self.session.get(f"{self.ollama_url}/api/tags", timeout=5)
             if response.status_code == 200:
-                models = response.json().get("models", [])
+                models = _json_loads(response.content).get("models", [])
                 model_names = [model["name"] for model in models]
                 return self.model_name in model_names
         except:
             pass
         return False
     
+    async def _post_generate(self, payload: Dict, timeout: float) -> httpx.Response:
+        """POST to Ollama's generate endpoint through the circuit breaker"""
+        if not self.breaker.allow_request():
+            raise CircuitOpenError("Ollama circuit is open")
+        
+        started = time.monotonic()
+        try:
+            response = await self.http.post(
+                f"{self.ollama_url}/api/generate", json={"keep_alive": _KEEP_ALIVE, **payload},
+                timeout=self._adaptive_timeout("generate", timeout)
+            )
+        except httpx.TransportError:
+            # Connection failures and timeouts
+            self.breaker.record_failure()
+            raise
+        
+        self._record_status(response.status_code)
+        if response.status_code == 200:
+            self.latency_windows["generate"].append(time.monotonic() - started)
+        return response
+    
+    async def _stream_generate(self, payload: Dict, timeout: float) -> AsyncIterator[str]:
+        """Stream generated text fragments from Ollama through the circuit breaker"""
+        if not self.breaker.allow_request():
+            raise CircuitOpenError("Ollama circuit is open")
+        
+        connected = False
+        started = time.monotonic()
+        first_chunk = True
+        try:
+            async with self.http.stream(
+                "POST", f"{self.ollama_url}/api/generate", json={"keep_alive": _KEEP_ALIVE, **payload, "stream": True},
+                timeout=self._adaptive_timeout("stream", timeout)
+            ) as response:
+                connected = True
+                self._record_status(response.status_code)
+                if response.status_code != 200:
+                    raise Exception(f"Ollama API error: {response.status_code}")
+                
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    if first_chunk:
+                        # Waiting for the first chunk (prompt evaluation) is the longest read gap
+                        first_chunk = False
+                        self.latency_windows["stream"].append(time.monotonic() - started)
+                    chunk = _json_loads(line)
+                    yield chunk.get("response", "")
+                    if chunk.get("done"):
+                        break
+        except httpx.TransportError:
+            # Only failures before the response count against the breaker, not mid-stream read errors
+            if not connected:
+                self.breaker.record_failure()
+            raise
+    
+    def _adaptive_timeout(self, endpoint: str, default: float) -> float:
+        """Twice the rolling P95 latency for an endpoint, or the default until enough samples exist"""
+        window = self.latency_windows[endpoint]
+        if len(window) < _MIN_LATENCY_SAMPLES:
+            return default
+        ordered = sorted(window)
+        p95 = ordered[math.ceil(0.95 * len(ordered)) - 1]
+        return min(_MAX_TIMEOUT, max(_MIN_TIMEOUT, 2.0 * p95))
+    
+    def _record_status(self, status_code: int):
+        """Feed an Ollama response status into the circuit breaker"""
+        if status_code >= 500:
+            self.breaker.record_failure()
+            return
+        if self.breaker.state != "closed":
+            # Recovered: make the next construction re-probe instead of trusting a stale result
+            _availability_cache.pop((self.ollama_url, self.model_name), None)
+        self.breaker.record_success()
+    
     async def _install_ollama_model(self) -> bool:
         """Install Llama 3.1 model if not available"""
         try:
             print("🤖 Installing Llama 3.1 model... This may take a few minutes.")
-            result = subprocess.run([
-                "ollama", "pull", self.model_name
-            ], capture_output=True, text=True, timeout=300)
+            result = await asyncio.to_thread(
+                subprocess.run, ["ollama", "pull", self.model_name],
+                capture_output=True, text=True, timeout=300
+            )
             
             if result.returncode == 0:
                 print("✅ Llama 3.1 model installed successfully!")
@@ -65,29 +400,101 @@ class ModernHuntingAI:
         """Generate modern AI-powered hunting recommendation"""
         
         # Try to install model if not available
-        if not self.ollama_available:
+        if not await self._is_ollama_available():
             print("🔄 Ollama model not found, attempting to install...")
             self.ollama_available = await self._install_ollama_model()
         
-        if self.ollama_available:
+        return await self._execute_with_fallback(self.providers, location, species, weather_data, user_preferences)
+    
+    async def _execute_with_fallback(self, chain: List[tuple], *args) -> Dict:
+        """Return the first provider's answer, tagged with which one answered and why earlier ones did not"""
+        reasons = []
+        for name, provider, breaker in chain:
+            if breaker is not None and not breaker.allow_request():
+                reasons.append(f"{name}: circuit open")
+                continue
             try:
-                return await self._generate_with_llama3(location, species, weather_data, user_preferences)
+                result = await provider(*args)
             except Exception as e:
-                print(f"⚠️ Ollama failed, using fallback: {e}")
-                if self.fallback_ai:
-                    return await self.fallback_ai.get_hunting_recommendation(
-                        location, species, weather_data, user_preferences
-                    )
-        else:
-            print("⚠️ Using fallback AI system")
-            if self.fallback_ai:
-                return await self.fallback_ai.get_hunting_recommendation(
-                    location, species, weather_data, user_preferences
-                )
+                if breaker is not None:
+                    breaker.record_failure()
+                reasons.append(f"{name}: {e}")
+                print(f"⚠️ {name} recommendation failed, falling back: {e}")
+                continue
+            if breaker is not None:
+                breaker.record_success()
+            return {**result, "model_used": name, "fallback_reason": "; ".join(reasons) or None}
+        raise Exception(f"All recommendation providers failed: {'; '.join(reasons)}")
+    
+    async def _llama3_recommendation(
+        self,
+        location: str,
+        species: str,
+        weather_data: Dict,
+        user_preferences: Optional[Dict] = None
+    ) -> Dict:
+        """Llama 3.1 recommendation, served from the cache while it is fresh"""
+        if not await self._is_ollama_available():
+            raise Exception("Ollama model not available")
+        
+        cache_key = self._recommendation_cache_key(location, species, weather_data)
+        cached = self._recommendation_cache.get(cache_key) if cache_key else None
+        if cached is not None and cached[0] > time.time():
+            self._recommendation_cache.move_to_end(cache_key)
+            return cached[1]
         
-        # Ultimate fallback
+        recommendation = await self._generate_with_llama3(location, species, weather_data, user_preferences)
+        if cache_key:
+            self._cache_recommendation(cache_key, recommendation)
+        return recommendation
+    
+    async def _stale_recommendation(
+        self,
+        location: str,
+        species: str,
+        weather_data: Dict,
+        user_preferences: Optional[Dict] = None
+    ) -> Dict:
+        """Expired Llama answer for the same conditions, which beats the rule-based fallbacks"""
+        cache_key = self._recommendation_cache_key(location, species, weather_data)
+        cached = self._recommendation_cache.get(cache_key) if cache_key else None
+        if cached is None:
+            raise LookupError("no cached recommendation")
+        return cached[1]
+    
+    async def _basic_recommendation(
+        self,
+        location: str,
+        species: str,
+        weather_data: Dict,
+        user_preferences: Optional[Dict] = None
+    ) -> Dict:
+        """Provider wrapper around the basic template recommendation"""
         return self._generate_basic_recommendation(location, species, weather_data)
     
+    @staticmethod
+    def _recommendation_cache_key(location: str, species: str, weather_data: Dict) -> Optional[tuple]:
+        """Quantize the prompt inputs so near-identical weather shares a cached answer"""
+        try:
+            return (
+                location,
+                species,
+                round(weather_data.get("temperature", 50)),
+                round(weather_data.get("wind_speed", 5)),
+                round(weather_data.get("barometric_pressure", 30.0), 1),
+                round(weather_data.get("humidity", 50), -1)
+            )
+        except TypeError:
+            # Non-numeric readings are passed through uncached
+            return None
+    
+    def _cache_recommendation(self, cache_key: tuple, recommendation: Dict):
+        """Store a recommendation, evicting the least recently used entry when full"""
+        self._recommendation_cache[cache_key] = (time.time() + self._recommendation_ttl, recommendation)
+        self._recommendation_cache.move_to_end(cache_key)
+        if len(self._recommendation_cache) > self._recommendation_cache_size:
+            self._recommendation_cache.popitem(last=False)
+    
     async def _generate_with_llama3(
         self,
         location: str,
@@ -98,89 +505,86 @@ class ModernHuntingAI:
         """Generate recommendation using Llama 3.1"""
         
         # Create sophisticated prompt for modern AI
-        prompt = self._create_modern_prompt(location, species, weather_data, user_preferences)
+        prompt = self._create_modern_prompt(location, species, weather_data, user_preferences, structured=True)
+        
+        payload = self._recommendation_payload(prompt, structured=True)
         
+        try:
+            ai_response = "".join([fragment async for fragment in self._stream_generate(payload, timeout=30)]).strip()
+            return self._parse_modern_recommendation(ai_response, location, species, weather_data)
+        except Exception as e:
+            raise Exception(f"Failed to generate with Llama 3: {e}")
+    
+    def _recommendation_payload(self, prompt: str, structured: bool = False) -> Dict:
+        """Ollama generate payload for a hunting recommendation, in JSON mode when structured"""
         payload = {
             "model": self.model_name,
             "prompt": prompt,
-            "stream": False,
+            "stream": True,
             "options": {
                 "temperature": 0.7,
                 "top_p": 0.9,
-                "max_tokens": 1000
+                "num_predict": 1000
             }
         }
+        if structured:
+            payload["format"] = "json"
+        return payload
+    
+    async def stream_hunting_recommendation(
+        self,
+        location: str,
+        species: str,
+        weather_data: Dict,
+        user_preferences: Optional[Dict] = None
+    ) -> AsyncIterator[str]:
+        """Yield recommendation text as Llama 3.1 generates it"""
+        if await self._is_ollama_available():
+            prompt = self._create_modern_prompt(location, species, weather_data, user_preferences)
+            started = False
+            try:
+                async for fragment in self._stream_generate(self._recommendation_payload(prompt), timeout=30):
+                    started = True
+                    yield fragment
+                return
+            except Exception as e:
+                # Text already sent cannot be replaced, so only fall back before the first fragment
+                if started:
+                    raise
+                print(f"⚠️ Ollama failed, using fallback: {e}")
         
-        try:
-            response = requests.post(
-                f"{self.ollama_url}/api/generate",
-                json=payload,
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                ai_response = result.get("response", "").strip()
-                
-                return self._parse_modern_recommendation(ai_response, location, species, weather_data)
-            else:
-                raise Exception(f"Ollama API error: {response.status_code}")
-                
-        except Exception as e:
-            raise Exception(f"Failed to generate with Llama 3: {e}")
+        recommendation = await self.fallback_ai.get_hunting_recommendation(
+            location, species, weather_data, user_preferences
+        )
+        yield recommendation["recommendation"]
     
     def _create_modern_prompt(
         self,
         location: str,
         species: str,
         weather_data: Dict,
-        user_preferences: Optional[Dict] = None
+        user_preferences: Optional[Dict] = None,
+        structured: bool = False
     ) -> str:
-        """Create sophisticated prompt for modern AI"""
+        """Create sophisticated prompt for modern AI, asking for JSON sections when structured"""
         
         temp = weather_data.get("temperature", 50)
         wind_speed = weather_data.get("wind_speed", 5)
         pressure = weather_data.get("barometric_pressure", 30.0)
         humidity = weather_data.get("humidity", 50)
+        now = datetime.now()
         
-        prompt = f"""You are an expert hunting guide and wildlife biologist specializing in New Hampshire hunting, particularly the Colebrook region. You have decades of experience and deep knowledge of local wildlife patterns, terrain, and hunting strategies.
-
-HUNTING REQUEST:
-- Location: {location}
-- Target Species: {species}
-- Current Weather: {temp}°F, {wind_speed} mph winds, {pressure}" pressure, {humidity}% humidity
-- Season: {self._get_current_season()}
-- Time: {datetime.now().strftime('%A, %B %d, %Y at %I:%M %p')}
-
-EXPERTISE AREAS:
-- New Hampshire Fish & Game regulations
-- Wildlife Management Unit (WMU) characteristics
-- Species behavior patterns and seasonal movements
-- Weather impact on animal activity
-- Local terrain and hunting strategies
-- Safety protocols and best practices
-- Equipment recommendations
-
-Please provide a comprehensive hunting recommendation that includes:
-
-1. **WEATHER ANALYSIS**: How current conditions affect {species} behavior
-2. **OPTIMAL TIMES**: Best hunting windows for today/tomorrow
-3. **LOCATION STRATEGY**: Specific areas and tactics for {location}
-4. **EQUIPMENT ADVICE**: What gear to use and why
-5. **SAFETY CONSIDERATIONS**: Important safety reminders
-6. **SUCCESS TIPS**: Advanced strategies for this species and location
-7. **REGULATORY NOTES**: Any relevant NH hunting regulations
-
-Make your advice specific, practical, and actionable. Use your expertise to provide insights that go beyond basic information. Consider factors like:
-- Barometric pressure trends
-- Wind patterns and scent control
-- Terrain features specific to the area
-- Historical success patterns
-- Seasonal behavior changes
-
-Format your response in a clear, organized manner with specific recommendations."""
-
-        return prompt
+        template = _RECOMMENDATION_JSON_PROMPT if structured else _RECOMMENDATION_PROMPT
+        return template.format(
+            location=location,
+            species=species,
+            temp=temp,
+            wind_speed=wind_speed,
+            pressure=pressure,
+            humidity=humidity,
+            season=self._get_current_season(now),
+            time=now.strftime('%A, %B %d, %Y at %I:%M %p')
+        )
     
     def _parse_modern_recommendation(
         self,
@@ -190,9 +594,24 @@ Format your response in a clear, organized manner with specific recommendations.
         weather_data: Dict
     ) -> Dict:
         """Parse modern AI response into structured format"""
+        now = datetime.now()
+        
+        # JSON-mode answers keep their sections; anything else is passed through as prose
+        sections = None
+        try:
+            parsed = _json_loads(ai_response)
+            if isinstance(parsed, dict):
+                sections = parsed
+        except ValueError:
+            pass
+        if sections is not None:
+            ai_response = "\n\n".join(
+                f"{title}: {sections[key]}" for key, title in _RECOMMENDATION_SECTIONS if sections.get(key)
+            ) or ai_response
         
         return {
             "recommendation": ai_response,
+            "sections": sections,
             "confidence_score": 0.95,  # High confidence for modern AI
             "factors_considered": [
                 "Advanced weather pattern analysis",
@@ -204,8 +623,8 @@ Format your response in a clear, organized manner with specific recommendations.
                 "Safety protocols",
                 "Equipment optimization"
             ],
-            "generated_at": datetime.now().isoformat(),
-            "expires_at": (datetime.now() + timedelta(hours=6)).isoformat(),
+            "generated_at": now.isoformat(),
+            "expires_at": (now + _RECOMMENDATION_TTL).isoformat(),
             "ai_model": f"Llama 3.1 8B via Ollama (Modern AI)",
             "advanced_features": [
                 "Natural language understanding",
@@ -217,51 +636,33 @@ Format your response in a clear, organized manner with specific recommendations.
     
     def _generate_basic_recommendation(self, location: str, species: str, weather_data: Dict) -> Dict:
         """Ultimate fallback recommendation"""
-        return {
-            "recommendation": f"Basic hunting advice for {species} in {location}. Check local regulations and weather conditions.",
-            "confidence_score": 0.5,
-            "factors_considered": ["Basic weather", "Species", "Location"],
-            "generated_at": datetime.now().isoformat(),
-            "expires_at": (datetime.now() + timedelta(hours=6)).isoformat(),
-            "ai_model": "Basic Fallback System"
-        }
+        now = datetime.now()
+        recommendation = _BASIC_RECOMMENDATION_TEMPLATE.copy()
+        recommendation["recommendation"] = f"Basic hunting advice for {species} in {location}. Check local regulations and weather conditions."
+        recommendation["generated_at"] = now.isoformat()
+        recommendation["expires_at"] = (now + _RECOMMENDATION_TTL).isoformat()
+        return recommendation
     
-    def _get_current_season(self) -> str:
+    def _get_current_season(self, now: Optional[datetime] = None) -> str:
         """Determine current hunting season"""
-        month = datetime.now().month
-        if month in [9, 10, 11, 12]:
-            return "Fall"
-        elif month in [1, 2, 3]:
-            return "Winter"
-        elif month in [4, 5]:
-            return "Spring"
-        else:
-            return "Summer"
+        return _SEASON_BY_MONTH[(now or datetime.now()).month]
     
     async def get_species_specific_advice(self, species: str, location: str) -> Dict:
         """Get advanced species-specific advice using modern AI"""
-        if self.ollama_available:
+        if await self._is_ollama_available():
             try:
-                prompt = f"""As an expert wildlife biologist specializing in {species} in {location}, provide detailed hunting advice including:
-- Behavior patterns and seasonal changes
-- Habitat preferences and movement patterns
-- Optimal hunting strategies
-- Equipment recommendations
-- Safety considerations
-- Local area specific tips
-
-Be specific and practical in your advice."""
+                prompt = _SPECIES_ADVICE_PROMPT.format(species=species, location=location)
                 
                 payload = {
                     "model": self.model_name,
                     "prompt": prompt,
                     "stream": False,
-                    "options": {"temperature": 0.6, "max_tokens": 500}
+                    "options": {"temperature": 0.6, "num_predict": 500}
                 }
                 
-                response = requests.post(f"{self.ollama_url}/api/generate", json=payload, timeout=20)
+                response = await self._post_generate(payload, timeout=20)
                 if response.status_code == 200:
-                    result = response.json()
+                    result = _json_loads(response.content)
                     return {"advice": result.get("response", "").strip()}
             except:
                 pass
@@ -271,30 +672,26 @@ Be specific and practical in your advice."""
     
     async def analyze_weather_impact(self, weather_data: Dict, species: str) -> Dict:
         """Advanced weather impact analysis using modern AI"""
-        if self.ollama_available:
+        if await self._is_ollama_available():
             try:
-                prompt = f"""Analyze how these weather conditions affect {species} hunting:
-- Temperature: {weather_data.get('temperature', 'N/A')}°F
-- Wind Speed: {weather_data.get('wind_speed', 'N/A')} mph
-- Pressure: {weather_data.get('barometric_pressure', 'N/A')}"
-- Humidity: {weather_data.get('humidity', 'N/A')}%
-
-Provide specific insights on:
-- Animal activity patterns
-- Movement behavior changes
-- Hunting strategy adjustments
-- Optimal timing recommendations"""
+                prompt = _WEATHER_IMPACT_PROMPT.format(
+                    species=species,
+                    temperature=weather_data.get('temperature', 'N/A'),
+                    wind_speed=weather_data.get('wind_speed', 'N/A'),
+                    pressure=weather_data.get('barometric_pressure', 'N/A'),
+                    humidity=weather_data.get('humidity', 'N/A')
+                )
                 
                 payload = {
                     "model": self.model_name,
                     "prompt": prompt,
                     "stream": False,
-                    "options": {"temperature": 0.5, "max_tokens": 400}
+                    "options": {"temperature": 0.5, "num_predict": 400}
                 }
                 
-                response = requests.post(f"{self.ollama_url}/api/generate", json=payload, timeout=20)
+                response = await self._post_generate(payload, timeout=20)
                 if response.status_code == 200:
-                    result = response.json()
+                    result = _json_loads(response.content)
                     return {
                         "analysis": result.get("response", "").strip(),
                         "confidence": 0.95,
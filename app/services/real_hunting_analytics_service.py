@@ -4,11 +4,162 @@ Real Hunting Analytics Service for BigMoeHunter
 Provides accurate, real-world hunting analytics and predictions
 """
 
+import math
 import random
+from bisect import bisect_right
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 from app.services.hunting_data_service import hunting_data_manager
 
+
+# Forecast weather simulation: a dedicated generator (seedable in isolation) and its inputs
+_rng = random.Random()
+_FORECAST_CONDITIONS = ("Clear", "Partly Cloudy", "Overcast", "Light Rain", "Snow")
+
+
+def _upper(bound: float) -> float:
+    """Threshold that keeps an inclusive upper bound in the lower bin under bisect_right"""
+    return math.nextafter(bound, math.inf)
+
+
+# Piecewise weather scoring per species: for temperature and wind, sorted thresholds
+# and one (score delta, opportunity factor, risk factor) bin per interval
+_SPECIES_WEATHER_TABLES = {
+    "White-tailed Deer": (
+        ((25, 35, _upper(50), _upper(60)), (
+            (0.1, None, "Very cold temperatures may reduce deer movement"),
+            (0.2, "Good temperature range for deer movement", None),
+            (0.4, "Optimal temperature range (35-50°F) for deer activity", None),
+            (0.2, "Good temperature range for deer movement", None),
+            (-0.1, None, "Warm temperatures may reduce deer activity")
+        )),
+        ((0, _upper(8), _upper(15)), (
+            (-0.2, None, "High winds may make deer uneasy and reduce movement"),
+            (0.3, "Light winds (0-8 mph) are ideal for scent control", None),
+            (0.1, "Moderate winds acceptable for deer hunting", None),
+            (-0.2, None, "High winds may make deer uneasy and reduce movement")
+        ))
+    ),
+    "Moose": (
+        ((10, 20, _upper(40), _upper(50)), (
+            (0, None, None),
+            (0.2, "Good temperature range for moose", None),
+            (0.4, "Cool temperatures are ideal for moose activity", None),
+            (0.2, "Good temperature range for moose", None),
+            (-0.2, None, "Warm temperatures cause heat stress for moose")
+        )),
+        ((0, _upper(15)), (
+            (-0.1, None, "High winds can make moose uneasy"),
+            (0.3, "Moderate winds are acceptable for moose hunting", None),
+            (-0.1, None, "High winds can make moose uneasy")
+        ))
+    ),
+    "Black Bear": (
+        ((30, _upper(60), _upper(70)), (
+            (0, None, None),
+            (0.3, "Good temperature range for bear activity", None),
+            (0, None, None),
+            (-0.1, None, "Hot temperatures may reduce bear activity")
+        )),
+        ((0, _upper(12)), (
+            (-0.1, None, "High winds can make bears uneasy"),
+            (0.2, "Light to moderate winds are good for bear hunting", None),
+            (-0.1, None, "High winds can make bears uneasy")
+        ))
+    )
+}
+
+# Deer condition scoring: keyword groups checked in priority order -> (score delta, opportunity factor)
+_CONDITION_RULES = (
+    (("clear", "sunny"), 0.2, "Clear conditions provide good visibility"),
+    (("partly", "cloudy"), 0.1, "Overcast conditions can increase deer activity"),
+    (("rain",), 0.1, "Light rain can mask scent and sound"),
+    (("snow",), 0.2, "Snow provides excellent tracking opportunities")
+)
+
+
+def _score_condition(condition: str) -> tuple:
+    """(deer score delta, opportunity factor, condition impact) for a lowercased condition"""
+    impact = "Good" if "clear" in condition or "partly" in condition else "Fair"
+    for keywords, delta, opportunity in _CONDITION_RULES:
+        if any(keyword in condition for keyword in keywords):
+            return delta, opportunity, impact
+    return 0, None, impact
+
+
+# Precomputed scores for the conditions the services report; anything else is scanned
+_CONDITION_SCORES = {
+    condition: _score_condition(condition)
+    for condition in ("clear", "sunny", "mostly sunny", "partly cloudy", "mostly cloudy", "cloudy",
+                      "overcast", "light rain", "rain", "heavy rain", "light snow", "snow", "fog")
+}
+
+# Fixed species-specific recommendations appended to every analysis
+_SPECIES_RECOMMENDATIONS = {
+    "White-tailed Deer": (
+        "Focus on dawn and dusk activity periods",
+        "Look for fresh scrapes and rubs",
+        "Use scent control products"
+    ),
+    "Moose": (
+        "Target wetland areas and clear-cuts",
+        "Use cow calls during rut season",
+        "Be prepared for remote terrain"
+    ),
+    "Black Bear": (
+        "Focus on berry patches and oak stands",
+        "Consider baiting if legal and permitted",
+        "Use heavy caliber firearms"
+    )
+}
+
+
+@dataclass(frozen=True, slots=True)
+class WeatherAnalysis:
+    score: float
+    temperature_impact: str
+    wind_impact: str
+    condition_impact: str
+
+
+@dataclass(frozen=True, slots=True)
+class TimeAnalysis:
+    score: float
+    current_hour: int
+    optimal_period: str
+
+
+@dataclass(frozen=True, slots=True)
+class MoonAnalysis:
+    current_phase: str
+    impact: str
+    score: float
+
+
+@dataclass(frozen=True, slots=True)
+class LocationAnalysis:
+    score: float
+    population_density: Any
+
+
+@dataclass(frozen=True, slots=True)
+class HuntingAnalysis:
+    """Result of one hunting conditions analysis; converted to a dict only at the API boundary"""
+    species: str
+    location: str
+    weather_data: Dict
+    success_probability: float
+    confidence_level: str
+    recommendations: List[str]
+    opportunity_factors: List[str]
+    risk_factors: List[str]
+    weather_analysis: WeatherAnalysis
+    time_analysis: TimeAnalysis
+    moon_analysis: MoonAnalysis
+    location_analysis: LocationAnalysis
+
+
 class RealHuntingAnalyticsService:
     def __init__(self):
         self.data_manager = hunting_data_manager
@@ -16,219 +167,10 @@ class RealHuntingAnalyticsService:
     def analyze_hunting_conditions(self, species: str, weather_data: Dict, location: str) -> Dict:
         """Analyze current hunting conditions and predict success probability"""
         try:
-            species_data = self.data_manager.hunting_data["species"].get(species)
-            if not species_data:
+            analysis = self._analyze_conditions(species, weather_data, location)
+            if analysis is None:
                 return {"error": "Species data not found"}
-
-            # Initialize scores
-            overall_score = 0
-            recommendations = []
-            opportunity_factors = []
-            risk_factors = []
-
-            # 1. Weather Impact Analysis
-            temp = weather_data.get('temperature', 50)
-            wind_speed = weather_data.get('wind_speed', 5)
-            condition = weather_data.get('condition', 'Partly Cloudy').lower()
-            pressure = weather_data.get('pressure', 30.0)
-
-            weather_score = 0
-            if species == "White-tailed Deer":
-                # Temperature analysis for deer
-                if 35 <= temp <= 50:
-                    weather_score += 0.4
-                    opportunity_factors.append("Optimal temperature range (35-50°F) for deer activity")
-                elif 25 <= temp <= 60:
-                    weather_score += 0.2
-                    opportunity_factors.append("Good temperature range for deer movement")
-                elif temp < 25:
-                    weather_score += 0.1
-                    risk_factors.append("Very cold temperatures may reduce deer movement")
-                else:
-                    weather_score -= 0.1
-                    risk_factors.append("Warm temperatures may reduce deer activity")
-
-                # Wind analysis for deer
-                if 0 <= wind_speed <= 8:
-                    weather_score += 0.3
-                    opportunity_factors.append("Light winds (0-8 mph) are ideal for scent control")
-                elif 8 < wind_speed <= 15:
-                    weather_score += 0.1
-                    opportunity_factors.append("Moderate winds acceptable for deer hunting")
-                else:
-                    weather_score -= 0.2
-                    risk_factors.append("High winds may make deer uneasy and reduce movement")
-
-                # Condition analysis for deer
-                if "clear" in condition or "sunny" in condition:
-                    weather_score += 0.2
-                    opportunity_factors.append("Clear conditions provide good visibility")
-                elif "partly" in condition or "cloudy" in condition:
-                    weather_score += 0.1
-                    opportunity_factors.append("Overcast conditions can increase deer activity")
-                elif "rain" in condition:
-                    weather_score += 0.1
-                    opportunity_factors.append("Light rain can mask scent and sound")
-                elif "snow" in condition:
-                    weather_score += 0.2
-                    opportunity_factors.append("Snow provides excellent tracking opportunities")
-
-            elif species == "Moose":
-                # Temperature analysis for moose
-                if 20 <= temp <= 40:
-                    weather_score += 0.4
-                    opportunity_factors.append("Cool temperatures are ideal for moose activity")
-                elif 10 <= temp <= 50:
-                    weather_score += 0.2
-                    opportunity_factors.append("Good temperature range for moose")
-                elif temp > 50:
-                    weather_score -= 0.2
-                    risk_factors.append("Warm temperatures cause heat stress for moose")
-
-                # Wind analysis for moose
-                if 0 <= wind_speed <= 15:
-                    weather_score += 0.3
-                    opportunity_factors.append("Moderate winds are acceptable for moose hunting")
-                else:
-                    weather_score -= 0.1
-                    risk_factors.append("High winds can make moose uneasy")
-
-            elif species == "Black Bear":
-                # Temperature analysis for bear
-                if 30 <= temp <= 60:
-                    weather_score += 0.3
-                    opportunity_factors.append("Good temperature range for bear activity")
-                elif temp > 70:
-                    weather_score -= 0.1
-                    risk_factors.append("Hot temperatures may reduce bear activity")
-
-                # Wind analysis for bear
-                if 0 <= wind_speed <= 12:
-                    weather_score += 0.2
-                    opportunity_factors.append("Light to moderate winds are good for bear hunting")
-                else:
-                    weather_score -= 0.1
-                    risk_factors.append("High winds can make bears uneasy")
-
-            overall_score += weather_score
-
-            # 2. Time of Day Analysis
-            current_hour = datetime.now().hour
-            time_score = 0
-            if 5 <= current_hour <= 9 or 16 <= current_hour <= 19:  # Dawn/Dusk
-                time_score = 0.9
-                opportunity_factors.append("Optimal time of day (dawn/dusk) for animal movement")
-            elif 9 <= current_hour <= 16:  # Midday
-                time_score = 0.4
-                risk_factors.append("Midday hunting can be less productive for most species")
-            else:  # Night
-                time_score = 0.2
-                risk_factors.append("Night hunting is generally not recommended")
-
-            overall_score += time_score * 0.2
-
-            # 3. Moon Phase Analysis
-            current_date_str = datetime.now().strftime("%Y-%m-%d")
-            moon_info = self.data_manager.moon_phases.get(current_date_str, {"phase": "Unknown", "impact": "Unknown"})
-            moon_score = 0
-            if "New Moon" in moon_info["phase"]:
-                moon_score = 0.8
-                opportunity_factors.append("New Moon - excellent for daytime hunting")
-            elif "First Quarter" in moon_info["phase"] or "Last Quarter" in moon_info["phase"]:
-                moon_score = 0.6
-                opportunity_factors.append("Quarter Moon - good hunting conditions")
-            elif "Full Moon" in moon_info["phase"]:
-                moon_score = 0.4
-                risk_factors.append("Full Moon - animals may be more nocturnal")
-            else:
-                moon_score = 0.5
-                opportunity_factors.append("Moderate moon phase - standard hunting conditions")
-
-            overall_score += moon_score * 0.1
-
-            # 4. Location Analysis
-            location_score = 0
-            if "Colebrook" in location or "Coös" in location:
-                location_score = 0.9
-                opportunity_factors.append(f"Excellent hunting location: {location}")
-                colebrook_data = species_data.get('colebrook_specific', {})
-                if colebrook_data:
-                    recommendations.append(f"Focus on {', '.join(colebrook_data.get('best_areas', []))}")
-                    if colebrook_data.get('population_density'):
-                        opportunity_factors.append(f"High population density: {colebrook_data['population_density']}")
-            else:
-                location_score = 0.6
-                risk_factors.append(f"Limited specific data for {location}")
-
-            overall_score += location_score * 0.2
-
-            # 5. Calculate Success Probability
-            success_probability = min(1.0, max(0.0, overall_score))
-            
-            # 6. Determine Confidence Level
-            if success_probability > 0.8:
-                confidence_level = "High"
-            elif success_probability > 0.6:
-                confidence_level = "Medium"
-            elif success_probability > 0.4:
-                confidence_level = "Low"
-            else:
-                confidence_level = "Very Low"
-
-            # 7. Generate Recommendations
-            if not recommendations:
-                if success_probability > 0.7:
-                    recommendations.append("Excellent hunting conditions - high success probability")
-                elif success_probability > 0.5:
-                    recommendations.append("Good hunting conditions - moderate success probability")
-                else:
-                    recommendations.append("Challenging conditions - consider waiting for better weather")
-
-            # Add species-specific recommendations
-            if species == "White-tailed Deer":
-                recommendations.append("Focus on dawn and dusk activity periods")
-                recommendations.append("Look for fresh scrapes and rubs")
-                recommendations.append("Use scent control products")
-            elif species == "Moose":
-                recommendations.append("Target wetland areas and clear-cuts")
-                recommendations.append("Use cow calls during rut season")
-                recommendations.append("Be prepared for remote terrain")
-            elif species == "Black Bear":
-                recommendations.append("Focus on berry patches and oak stands")
-                recommendations.append("Consider baiting if legal and permitted")
-                recommendations.append("Use heavy caliber firearms")
-
-            return {
-                "species": species,
-                "location": location,
-                "weather_data": weather_data,
-                "success_probability": round(success_probability, 2),
-                "confidence_level": confidence_level,
-                "recommendations": recommendations,
-                "opportunity_factors": opportunity_factors,
-                "risk_factors": risk_factors,
-                "weather_analysis": {
-                    "score": round(weather_score, 2),
-                    "temperature_impact": "Optimal" if 35 <= temp <= 50 else "Good" if 25 <= temp <= 60 else "Poor",
-                    "wind_impact": "Optimal" if 0 <= wind_speed <= 8 else "Good" if wind_speed <= 15 else "Poor",
-                    "condition_impact": "Good" if "clear" in condition or "partly" in condition else "Fair"
-                },
-                "time_analysis": {
-                    "score": round(time_score, 2),
-                    "current_hour": current_hour,
-                    "optimal_period": "Dawn/Dusk" if 5 <= current_hour <= 9 or 16 <= current_hour <= 19 else "Midday" if 9 <= current_hour <= 16 else "Night"
-                },
-                "moon_analysis": {
-                    "current_phase": moon_info["phase"],
-                    "impact": moon_info["impact"],
-                    "score": round(moon_score, 2)
-                },
-                "location_analysis": {
-                    "score": round(location_score, 2),
-                    "population_density": species_data.get('colebrook_specific', {}).get('population_density', 'Unknown')
-                }
-            }
-
+            return asdict(analysis)
         except Exception as e:
             return {
                 "error": f"Failed to analyze hunting conditions: {str(e)}",
@@ -236,54 +178,204 @@ class RealHuntingAnalyticsService:
                 "location": location
             }
 
+    def _analyze_conditions(self, species: str, weather_data: Dict, location: str) -> Optional[HuntingAnalysis]:
+        """Score the conditions for a species, or None if the species is unknown"""
+        species_data = self.data_manager.hunting_data["species"].get(species)
+        if not species_data:
+            return None
+        colebrook_data = species_data.get('colebrook_specific') or {}
+
+        # One timestamp for every time-dependent factor in this analysis
+        now = datetime.now()
+
+        # Initialize scores
+        overall_score = 0
+        recommendations = []
+        opportunity_factors = []
+        risk_factors = []
+
+        # 1. Weather Impact Analysis
+        temp = weather_data.get('temperature', 50)
+        wind_speed = weather_data.get('wind_speed', 5)
+        condition = weather_data.get('condition', 'Partly Cloudy').lower()
+        pressure = weather_data.get('pressure', 30.0)
+
+        weather_score = 0
+        for (thresholds, bins), value in zip(_SPECIES_WEATHER_TABLES.get(species, ()), (temp, wind_speed)):
+            delta, opportunity, risk = bins[bisect_right(thresholds, value)]
+            weather_score += delta
+            if opportunity:
+                opportunity_factors.append(opportunity)
+            if risk:
+                risk_factors.append(risk)
+
+        condition_delta, condition_opportunity, condition_impact = (
+            _CONDITION_SCORES.get(condition) or _score_condition(condition)
+        )
+        if species == "White-tailed Deer" and condition_opportunity:
+            # Condition analysis for deer
+            weather_score += condition_delta
+            opportunity_factors.append(condition_opportunity)
+
+        overall_score += weather_score
+
+        # 2. Time of Day Analysis
+        current_hour = now.hour
+        time_score = 0
+        if 5 <= current_hour <= 9 or 16 <= current_hour <= 19:  # Dawn/Dusk
+            time_score = 0.9
+            opportunity_factors.append("Optimal time of day (dawn/dusk) for animal movement")
+        elif 9 <= current_hour <= 16:  # Midday
+            time_score = 0.4
+            risk_factors.append("Midday hunting can be less productive for most species")
+        else:  # Night
+            time_score = 0.2
+            risk_factors.append("Night hunting is generally not recommended")
+
+        overall_score += time_score * 0.2
+
+        # 3. Moon Phase Analysis
+        current_date_str = now.strftime("%Y-%m-%d")
+        moon_info = self.data_manager.moon_phases.get(current_date_str, {"phase": "Unknown", "impact": "Unknown"})
+        moon_score = 0
+        if "New Moon" in moon_info["phase"]:
+            moon_score = 0.8
+            opportunity_factors.append("New Moon - excellent for daytime hunting")
+        elif "First Quarter" in moon_info["phase"] or "Last Quarter" in moon_info["phase"]:
+            moon_score = 0.6
+            opportunity_factors.append("Quarter Moon - good hunting conditions")
+        elif "Full Moon" in moon_info["phase"]:
+            moon_score = 0.4
+            risk_factors.append("Full Moon - animals may be more nocturnal")
+        else:
+            moon_score = 0.5
+            opportunity_factors.append("Moderate moon phase - standard hunting conditions")
+
+        overall_score += moon_score * 0.1
+
+        # 4. Location Analysis
+        location_score = 0
+        if "Colebrook" in location or "Coös" in location:
+            location_score = 0.9
+            opportunity_factors.append(f"Excellent hunting location: {location}")
+            if colebrook_data:
+                recommendations.append(f"Focus on {', '.join(colebrook_data.get('best_areas', []))}")
+                if colebrook_data.get('population_density'):
+                    opportunity_factors.append(f"High population density: {colebrook_data['population_density']}")
+        else:
+            location_score = 0.6
+            risk_factors.append(f"Limited specific data for {location}")
+
+        overall_score += location_score * 0.2
+
+        # 5. Calculate Success Probability
+        success_probability = min(1.0, max(0.0, overall_score))
+        
+        # 6. Determine Confidence Level
+        if success_probability > 0.8:
+            confidence_level = "High"
+        elif success_probability > 0.6:
+            confidence_level = "Medium"
+        elif success_probability > 0.4:
+            confidence_level = "Low"
+        else:
+            confidence_level = "Very Low"
+
+        # 7. Generate Recommendations
+        if not recommendations:
+            if success_probability > 0.7:
+                recommendations.append("Excellent hunting conditions - high success probability")
+            elif success_probability > 0.5:
+                recommendations.append("Good hunting conditions - moderate success probability")
+            else:
+                recommendations.append("Challenging conditions - consider waiting for better weather")
+
+        # Add species-specific recommendations
+        recommendations.extend(_SPECIES_RECOMMENDATIONS.get(species, ()))
+
+        return HuntingAnalysis(
+            species=species,
+            location=location,
+            weather_data=weather_data,
+            success_probability=round(success_probability, 2),
+            confidence_level=confidence_level,
+            recommendations=recommendations,
+            opportunity_factors=opportunity_factors,
+            risk_factors=risk_factors,
+            weather_analysis=WeatherAnalysis(
+                score=round(weather_score, 2),
+                temperature_impact="Optimal" if 35 <= temp <= 50 else "Good" if 25 <= temp <= 60 else "Poor",
+                wind_impact="Optimal" if 0 <= wind_speed <= 8 else "Good" if wind_speed <= 15 else "Poor",
+                condition_impact=condition_impact
+            ),
+            time_analysis=TimeAnalysis(
+                score=round(time_score, 2),
+                current_hour=current_hour,
+                optimal_period="Dawn/Dusk" if 5 <= current_hour <= 9 or 16 <= current_hour <= 19 else "Midday" if 9 <= current_hour <= 16 else "Night"
+            ),
+            moon_analysis=MoonAnalysis(
+                current_phase=moon_info["phase"],
+                impact=moon_info["impact"],
+                score=round(moon_score, 2)
+            ),
+            location_analysis=LocationAnalysis(
+                score=round(location_score, 2),
+                population_density=colebrook_data.get('population_density', 'Unknown')
+            )
+        )
+
     def get_hunting_forecast(self, days: int = 7) -> Dict:
         """Get hunting forecast for next 7 days"""
         try:
-            forecast = []
             today = datetime.now()
+            dates = [(today + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(days)]
             
-            for i in range(days):
-                date = today + timedelta(days=i)
-                
-                # Simulate realistic weather data
-                temp = random.randint(25, 65)
-                wind_speed = random.randint(0, 20)
-                conditions = random.choice(["Clear", "Partly Cloudy", "Overcast", "Light Rain", "Snow"])
-                pressure = round(random.uniform(29.8, 30.5), 2)
-
-                simulated_weather = {
-                    "date": date.strftime("%Y-%m-%d"),
+            # Simulate realistic weather data, one draw per field for all days
+            temps = [_rng.randrange(25, 66) for _ in dates]
+            wind_speeds = [_rng.randrange(0, 21) for _ in dates]
+            conditions = _rng.choices(_FORECAST_CONDITIONS, k=days)
+            pressures = [round(_rng.uniform(29.8, 30.5), 2) for _ in dates]
+            simulated_weathers = [
+                {
+                    "date": date,
                     "temperature": temp,
                     "wind_speed": wind_speed,
-                    "condition": conditions,
+                    "condition": condition,
                     "pressure": pressure
                 }
+                for date, temp, wind_speed, condition, pressure in zip(dates, temps, wind_speeds, conditions, pressures)
+            ]
 
-                # Get analytics for White-tailed Deer
-                analytics = self.analyze_hunting_conditions("White-tailed Deer", simulated_weather, "Colebrook, NH")
-                
+            # Get analytics for White-tailed Deer; scoring is pure CPU, so days are computed inline
+            daily_analytics = [
+                self._analyze_conditions("White-tailed Deer", simulated_weather, "Colebrook, NH")
+                for simulated_weather in simulated_weathers
+            ]
+
+            forecast = []
+            for date, simulated_weather, analytics in zip(dates, simulated_weathers, daily_analytics):
                 # Determine overall rating based on success probability
                 rating = "Poor"
-                if analytics["success_probability"] > 0.8:
+                if analytics.success_probability > 0.8:
                     rating = "Excellent"
-                elif analytics["success_probability"] > 0.6:
+                elif analytics.success_probability > 0.6:
                     rating = "Good"
-                elif analytics["success_probability"] > 0.4:
+                elif analytics.success_probability > 0.4:
                     rating = "Fair"
                 
                 forecast.append({
-                    "date": date.strftime("%Y-%m-%d"),
+                    "date": date,
                     "weather": simulated_weather,
                     "hunting_rating": rating,
-                    "success_probability": analytics["success_probability"],
-                    "recommendations": analytics["recommendations"][:2],  # Limit to 2 recommendations
-                    "opportunity_factors": analytics["opportunity_factors"][:2]  # Limit to 2 factors
+                    "success_probability": analytics.success_probability,
+                    "recommendations": analytics.recommendations[:2],  # Limit to 2 recommendations
+                    "opportunity_factors": analytics.opportunity_factors[:2]  # Limit to 2 factors
                 })
             
             return {
                 "forecast": forecast,
                 "location": "Colebrook, NH",
-                "generated_at": datetime.now().isoformat()
+                "generated_at": today.isoformat()
             }
 
         except Exception as e:
@@ -293,5 +385,9 @@ class RealHuntingAnalyticsService:
                 "location": "Colebrook, NH"
             }
 
+    async def get_hunting_forecast_async(self, days: int = 7) -> Dict:
+        """Async entry point for event-loop callers; the forecast does no I/O, so it runs inline"""
+        return self.get_hunting_forecast(days)
+
 # Global instance
 real_hunting_analytics = RealHuntingAnalyticsService()
@@ -4,484 +4,149 @@ Real Hunting Spots Service for BigMoeHunter
 Comprehensive Coös County hunting locations with real data
 """
 
+import functools
+import heapq
 import json
+import math
+import os
+import sys
 from datetime import datetime
-from typing import Dict, List, Optional
+from itertools import islice
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# orjson parses the data file several times faster; stdlib json accepts the same bytes
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+_EARTH_RADIUS_MILES = 3958.8
+
+_INVALID_LOCATION_TYPE = MappingProxyType({"error": "Invalid location type"})
+
+# Spots, harvest history and access points, kept out of the module so importing it compiles no data literals
+_DATA_PATH = os.path.join(os.path.dirname(__file__), "data", "real_hunting_spots.json")
+
+
+def _freeze(obj):
+    """Recursively convert dicts to read-only mappings and lists to tuples, interning strings"""
+    if isinstance(obj, dict):
+        return MappingProxyType({_freeze(key): _freeze(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(item) for item in obj)
+    if isinstance(obj, str):
+        return sys.intern(obj)
+    return obj
+
+
+@functools.lru_cache(maxsize=1)
+def _load_spot_data() -> Dict:
+    """Read the static hunting spot data file in one pass, as read-only views shared by every instance"""
+    with open(_DATA_PATH, "rb") as f:
+        return _freeze(_json_loads(f.read()))
+
 
 class RealHuntingSpotsService:
-    """Service for real Coös County hunting spots data"""
+    """
+    Service for real Coös County hunting spots data.
+    The data and every cached response are read-only views shared between callers.
+    """
     
     def __init__(self):
-        self.hunting_spots = self._initialize_real_hunting_spots()
-        self.harvest_data = self._initialize_harvest_data()
-        self.access_points = self._initialize_access_points()
-    
-    def _initialize_real_hunting_spots(self) -> Dict:
-        """Initialize real hunting spots in Coös County"""
-        return {
-            "public_lands": {
-                "connecticut_lakes_state_forest": {
-                    "name": "Connecticut Lakes State Forest",
-                    "size": "25,000 acres",
-                    "access": "Public",
-                    "coordinates": {"lat": 45.0833, "lon": -71.2500},
-                    "species": {
-                        "moose": {
-                            "population": "High",
-                            "success_rate": "15-20%",
-                            "best_areas": [
-                                "First Connecticut Lake area",
-                                "Second Connecticut Lake wetlands",
-                                "Third Connecticut Lake region",
-                                "Fourth Connecticut Lake access"
-                            ],
-                        "harvest_data": {
-                            "2025": 24,
-                            "2024": 20,
-                            "2023": 18,
-                            "2022": 22,
-                            "2021": 16,
-                            "average": 20.0
-                        }
-                        },
-                        "deer": {
-                            "population": "Medium",
-                            "success_rate": "12-18%",
-                            "best_areas": [
-                                "Mixed hardwood stands",
-                                "Agricultural edges",
-                                "Stream corridors"
-                            ],
-                            "harvest_data": {
-                                "2025": 58,
-                                "2024": 48,
-                                "2023": 45,
-                                "2022": 52,
-                                "2021": 38,
-                                "average": 48.2
-                            }
-                        },
-                        "bear": {
-                            "population": "Medium",
-                            "success_rate": "8-12%",
-                            "best_areas": [
-                                "Berry patches",
-                                "Oak stands",
-                                "Wetland edges"
-                            ],
-                            "harvest_data": {
-                                "2025": 12,
-                                "2024": 10,
-                                "2023": 8,
-                                "2022": 12,
-                                "2021": 6,
-                                "average": 9.6
-                            }
-                        }
-                    },
-                    "access_points": [
-                        {
-                            "name": "Route 3 Access",
-                            "coordinates": {"lat": 45.0833, "lon": -71.2500},
-                            "parking": "Yes",
-                            "difficulty": "Easy"
-                        },
-                        {
-                            "name": "Beaver Brook Access",
-                            "coordinates": {"lat": 45.1000, "lon": -71.2000},
-                            "parking": "Limited",
-                            "difficulty": "Moderate"
-                        }
-                    ],
-                    "regulations": "Standard NH hunting regulations apply",
-                    "difficulty": "Moderate to difficult terrain",
-                    "notes": "Prime moose hunting area with excellent water access"
-                },
-                "colebrook_state_forest": {
-                    "name": "Colebrook State Forest",
-                    "size": "8,500 acres",
-                    "access": "Public",
-                    "coordinates": {"lat": 44.8942, "lon": -71.4962},
-                    "species": {
-                        "deer": {
-                            "population": "High",
-                            "success_rate": "20-25%",
-                            "best_areas": [
-                                "Apple orchards",
-                                "Agricultural edges",
-                                "Mixed hardwood stands"
-                            ],
-                            "harvest_data": {
-                                "2023": 68,
-                                "2022": 72,
-                                "2021": 61,
-                                "average": 67.0
-                            }
-                        },
-                        "turkey": {
-                            "population": "Medium",
-                            "success_rate": "15-20%",
-                            "best_areas": [
-                                "Open fields",
-                                "Forest edges",
-                                "Food plots"
-                            ],
-                            "harvest_data": {
-                                "2023": 23,
-                                "2022": 28,
-                                "2021": 19,
-                                "average": 23.3
-                            }
-                        }
-                    },
-                    "access_points": [
-                        {
-                            "name": "Route 3 Access",
-                            "coordinates": {"lat": 44.8942, "lon": -71.4962},
-                            "parking": "Yes",
-                            "difficulty": "Easy"
-                        }
-                    ],
-                    "regulations": "Standard NH hunting regulations apply",
-                    "difficulty": "Easy to moderate terrain",
-                    "notes": "Excellent deer hunting with good access"
-                },
-                "dixville_notch_state_park": {
-                    "name": "Dixville Notch State Park",
-                    "size": "1,200 acres",
-                    "access": "Public",
-                    "coordinates": {"lat": 44.8667, "lon": -71.2833},
-                    "species": {
-                        "bear": {
-                            "population": "High",
-                            "success_rate": "18-25%",
-                            "best_areas": [
-                                "Wetland areas",
-                                "Berry patches",
-                                "Rock outcroppings"
-                            ],
-                            "harvest_data": {
-                                "2023": 15,
-                                "2022": 18,
-                                "2021": 12,
-                                "average": 15.0
-                            }
-                        },
-                        "deer": {
-                            "population": "Medium",
-                            "success_rate": "10-15%",
-                            "best_areas": [
-                                "Mixed forest stands",
-                                "Wetland edges"
-                            ],
-                            "harvest_data": {
-                                "2023": 12,
-                                "2022": 15,
-                                "2021": 9,
-                                "average": 12.0
-                            }
-                        }
-                    },
-                    "access_points": [
-                        {
-                            "name": "Route 26 Access",
-                            "coordinates": {"lat": 44.8667, "lon": -71.2833},
-                            "parking": "Yes",
-                            "difficulty": "Moderate"
-                        }
-                    ],
-                    "regulations": "Some areas restricted, check signage",
-                    "difficulty": "Moderate to difficult terrain",
-                    "notes": "Prime bear hunting area with challenging terrain"
-                },
-                "pittsburg_clarksville_region": {
-                    "name": "Pittsburg-Clarksville Region",
-                    "size": "15,000 acres",
-                    "access": "Public/Private",
-                    "coordinates": {"lat": 45.0500, "lon": -71.4000},
-                    "species": {
-                        "moose": {
-                            "population": "Very High",
-                            "success_rate": "25-30%",
-                            "best_areas": [
-                                "Wetland complexes",
-                                "Beaver ponds",
-                                "Stream corridors"
-                            ],
-                            "harvest_data": {
-                                "2023": 35,
-                                "2022": 42,
-                                "2021": 28,
-                                "average": 35.0
-                            }
-                        },
-                        "deer": {
-                            "population": "Medium",
-                            "success_rate": "15-20%",
-                            "best_areas": [
-                                "Mixed forests",
-                                "Agricultural areas"
-                            ],
-                            "harvest_data": {
-                                "2023": 28,
-                                "2022": 32,
-                                "2021": 24,
-                                "average": 28.0
-                            }
-                        }
-                    },
-                    "access_points": [
-                        {
-                            "name": "Pittsburg Access",
-                            "coordinates": {"lat": 45.0500, "lon": -71.4000},
-                            "parking": "Yes",
-                            "difficulty": "Easy"
-                        }
-                    ],
-                    "regulations": "Mixed public/private land, check boundaries",
-                    "difficulty": "Easy to moderate terrain",
-                    "notes": "Highest moose success rates in the county"
-                }
-            },
-            "private_lands": {
-                "agricultural_areas": {
-                    "name": "Agricultural Areas",
-                    "description": "Farm fields and orchards",
-                    "access": "Permission required",
-                    "species": {
-                        "deer": {
-                            "population": "Very High",
-                            "success_rate": "30-40%",
-                            "best_times": "Early morning, late afternoon",
-                            "harvest_data": {
-                                "2023": 120,
-                                "2022": 135,
-                                "2021": 108,
-                                "average": 121.0
-                            }
-                        },
-                        "turkey": {
-                            "population": "High",
-                            "success_rate": "25-35%",
-                            "best_times": "Early morning",
-                            "harvest_data": {
-                                "2023": 45,
-                                "2022": 52,
-                                "2021": 38,
-                                "average": 45.0
-                            }
-                        }
-                    },
-                    "tips": "Contact landowners well in advance, offer to help with farm work",
-                    "notes": "Highest success rates but requires landowner permission"
-                },
-                "woodland_properties": {
-                    "name": "Private Woodland Properties",
-                    "description": "Private forest lands",
-                    "access": "Permission required",
-                    "species": {
-                        "deer": {
-                            "population": "High",
-                            "success_rate": "20-30%",
-                            "best_times": "Dawn and dusk",
-                            "harvest_data": {
-                                "2023": 85,
-                                "2022": 92,
-                                "2021": 78,
-                                "average": 85.0
-                            }
-                        },
-                        "bear": {
-                            "population": "Medium",
-                            "success_rate": "15-20%",
-                            "best_times": "Early morning, late afternoon",
-                            "harvest_data": {
-                                "2023": 22,
-                                "2022": 28,
-                                "2021": 18,
-                                "average": 22.7
-                            }
-                        }
-                    },
-                    "tips": "Respect property boundaries, offer to share harvest",
-                    "notes": "Good hunting opportunities with proper permission"
-                }
-            }
-        }
+        data = _load_spot_data()
+        self.hunting_spots = data["hunting_spots"]
+        self.harvest_data = data["harvest_data"]
+        self.access_points = data["access_points"]
+        
+        # The data is static, so the unfiltered responses are built once and shared
+        self._all_spots_response = MappingProxyType({
+            "public_lands": self.hunting_spots["public_lands"],
+            "private_lands": self.hunting_spots["private_lands"],
+            "harvest_data": self.harvest_data,
+            "access_points": self.access_points
+        })
+        self._type_responses = MappingProxyType({
+            location_type: MappingProxyType({
+                "location_type": location_type,
+                "spots": self.hunting_spots[f"{location_type}_lands"],
+                "total_spots": len(self.hunting_spots[f"{location_type}_lands"])
+            })
+            for location_type in ("public", "private")
+        })
+        self._harvest_statistics = _freeze(self._build_harvest_statistics())
+        # species -> location name -> harvest, and the inverse, from each species' top_locations list
+        self._top_locations_by_species = _freeze({
+            species: {entry["name"]: entry["harvest"] for entry in species_data["top_locations"]}
+            for species, species_data in self.harvest_data["by_species"].items()
+        })
+        top_species_by_location = {}
+        for species, locations in self._top_locations_by_species.items():
+            for location, harvest in locations.items():
+                top_species_by_location.setdefault(location, {})[species] = harvest
+        self._top_species_by_location = _freeze(top_species_by_location)
+        self._access_points_response = _freeze(self._build_access_points_response())
+        # (lat, lon in radians, cos lat, access point) for haversine nearest-neighbour queries
+        self._access_point_coords = tuple(
+            (math.radians(ap["coordinates"]["lat"]), math.radians(ap["coordinates"]["lon"]),
+             math.cos(math.radians(ap["coordinates"]["lat"])), ap)
+            for ap in self.access_points["major_access_points"] + self.access_points["secondary_access_points"]
+        )
+        # Pre-encoded JSON bodies for the static responses, so routes can skip re-encoding them
+        self._all_spots_json = json.dumps(self._all_spots_response, default=dict).encode()
+        self._harvest_statistics_json = json.dumps(self._harvest_statistics, default=dict).encode()
+        self._access_points_json = json.dumps(self._access_points_response, default=dict).encode()
+        self._spots_by_species = _freeze(self._build_species_index())
+        self._search_blobs = self._build_search_blobs()
+        # Per-instance cache (a decorated method would pin instances in a class-level cache); few combinations exist
+        self._resolve_spots = functools.lru_cache(maxsize=32)(self._resolve_spots_impl)
     
-    def _initialize_harvest_data(self) -> Dict:
-        """Initialize harvest data by location and species"""
-        return {
-            "by_species": {
-                "moose": {
-                    "total_harvest_2025": 108,
-                    "total_harvest_2024": 95,
-                    "total_harvest_2023": 88,
-                    "total_harvest_2022": 102,
-                    "total_harvest_2021": 74,
-                    "average_harvest": 93.4,
-                    "top_locations": [
-                        {"name": "Pittsburg-Clarksville Region", "harvest": 35},
-                        {"name": "Connecticut Lakes State Forest", "harvest": 18},
-                        {"name": "Private Lands", "harvest": 20},
-                        {"name": "Other Public Lands", "harvest": 15}
-                    ]
-                },
-                "deer": {
-                    "total_harvest_2025": 385,
-                    "total_harvest_2024": 352,
-                    "total_harvest_2023": 338,
-                    "total_harvest_2022": 367,
-                    "total_harvest_2021": 310,
-                    "average_harvest": 350.4,
-                    "top_locations": [
-                        {"name": "Agricultural Areas", "harvest": 120},
-                        {"name": "Colebrook State Forest", "harvest": 68},
-                        {"name": "Private Woodlands", "harvest": 85},
-                        {"name": "Connecticut Lakes", "harvest": 45},
-                        {"name": "Other Locations", "harvest": 20}
-                    ]
-                },
-                "bear": {
-                    "total_harvest_2025": 68,
-                    "total_harvest_2024": 62,
-                    "total_harvest_2023": 57,
-                    "total_harvest_2022": 70,
-                    "total_harvest_2021": 48,
-                    "average_harvest": 61.0,
-                    "top_locations": [
-                        {"name": "Dixville Notch State Park", "harvest": 15},
-                        {"name": "Private Woodlands", "harvest": 22},
-                        {"name": "Connecticut Lakes", "harvest": 8},
-                        {"name": "Other Locations", "harvest": 12}
-                    ]
-                },
-                "turkey": {
-                    "total_harvest_2025": 78,
-                    "total_harvest_2024": 72,
-                    "total_harvest_2023": 68,
-                    "total_harvest_2022": 80,
-                    "total_harvest_2021": 57,
-                    "average_harvest": 71.0,
-                    "top_locations": [
-                        {"name": "Agricultural Areas", "harvest": 45},
-                        {"name": "Colebrook State Forest", "harvest": 23}
-                    ]
-                }
-            },
-            "by_location": {
-                "connecticut_lakes_state_forest": {
-                    "total_harvest_2023": 71,
-                    "species_breakdown": {
-                        "moose": 18,
-                        "deer": 45,
-                        "bear": 8
-                    }
-                },
-                "colebrook_state_forest": {
-                    "total_harvest_2023": 91,
-                    "species_breakdown": {
-                        "deer": 68,
-                        "turkey": 23
-                    }
-                },
-                "dixville_notch_state_park": {
-                    "total_harvest_2023": 27,
-                    "species_breakdown": {
-                        "bear": 15,
-                        "deer": 12
-                    }
-                },
-                "pittsburg_clarksville_region": {
-                    "total_harvest_2023": 63,
-                    "species_breakdown": {
-                        "moose": 35,
-                        "deer": 28
-                    }
-                }
-            }
-        }
+    def _build_species_index(self) -> Dict:
+        """Map each species to the public and private spots that have it, in spot order"""
+        index = {}
+        for land_type in ("public_lands", "private_lands"):
+            for spot_name, spot_data in self.hunting_spots[land_type].items():
+                for species in spot_data["species"]:
+                    spots = index.setdefault(species, {"public_lands": {}, "private_lands": {}})
+                    spots[land_type][spot_name] = spot_data
+        return index
     
-    def _initialize_access_points(self) -> Dict:
-        """Initialize detailed access point information"""
+    def _build_search_blobs(self) -> Dict:
+        """Per land type, (spot name, lowercased searchable text, spot data) for every spot"""
+        # NUL never occurs in the data, so no query can match across two fields
         return {
-            "major_access_points": [
-                {
-                    "name": "Route 3 - Colebrook",
-                    "coordinates": {"lat": 44.8942, "lon": -71.4962},
-                    "access_to": ["Colebrook State Forest", "Connecticut Lakes"],
-                    "parking": "Yes",
-                    "facilities": ["Restrooms", "Information"],
-                    "difficulty": "Easy"
-                },
-                {
-                    "name": "Route 26 - Dixville Notch",
-                    "coordinates": {"lat": 44.8667, "lon": -71.2833},
-                    "access_to": ["Dixville Notch State Park"],
-                    "parking": "Yes",
-                    "facilities": ["Restrooms"],
-                    "difficulty": "Moderate"
-                },
-                {
-                    "name": "Pittsburg Access Road",
-                    "coordinates": {"lat": 45.0500, "lon": -71.4000},
-                    "access_to": ["Pittsburg-Clarksville Region"],
-                    "parking": "Yes",
-                    "facilities": ["Information"],
-                    "difficulty": "Easy"
-                }
-            ],
-            "secondary_access_points": [
-                {
-                    "name": "Beaver Brook Access",
-                    "coordinates": {"lat": 45.1000, "lon": -71.2000},
-                    "access_to": ["Connecticut Lakes State Forest"],
-                    "parking": "Limited",
-                    "facilities": [],
-                    "difficulty": "Moderate"
-                },
-                {
-                    "name": "Perry Stream Access",
-                    "coordinates": {"lat": 45.0833, "lon": -71.2500},
-                    "access_to": ["Connecticut Lakes State Forest"],
-                    "parking": "Limited",
-                    "facilities": [],
-                    "difficulty": "Difficult"
-                }
+            land_type: [
+                (spot_name, "\0".join([spot_name.lower(), spot_data["name"].lower(), *spot_data["species"]]), spot_data)
+                for spot_name, spot_data in self.hunting_spots[land_type].items()
             ]
+            for land_type in ("public_lands", "private_lands")
         }
     
     def get_hunting_spots(self, species: str = None, location_type: str = None) -> Dict:
         """Get hunting spots filtered by species and location type"""
-        try:
-            if species and location_type:
-                return self._get_filtered_spots(species, location_type)
-            elif species:
-                return self._get_spots_by_species(species)
-            elif location_type:
-                return self._get_spots_by_type(location_type)
-            else:
-                return {
-                    "public_lands": self.hunting_spots["public_lands"],
-                    "private_lands": self.hunting_spots["private_lands"],
-                    "harvest_data": self.harvest_data,
-                    "access_points": self.access_points
-                }
-        except Exception as e:
-            return {"error": f"Failed to get hunting spots: {str(e)}"}
+        return self._resolve_spots(species, location_type)
+    
+    def get_hunting_spots_json(self) -> bytes:
+        """Get all hunting spots as a pre-encoded JSON body"""
+        return self._all_spots_json
+    
+    def _resolve_spots_impl(self, species: Optional[str], location_type: Optional[str]) -> MappingProxyType:
+        """Build the read-only response for one (species, location type) combination"""
+        if species and location_type:
+            return MappingProxyType(self._get_filtered_spots(species, location_type))
+        elif species:
+            return MappingProxyType(self._get_spots_by_species(species))
+        elif location_type:
+            return self._get_spots_by_type(location_type)
+        else:
+            return self._all_spots_response
     
     def _get_filtered_spots(self, species: str, location_type: str) -> Dict:
         """Get spots filtered by both species and location type"""
         filtered_spots = {}
-        
-        if location_type == "public":
-            for spot_name, spot_data in self.hunting_spots["public_lands"].items():
-                if species in spot_data["species"]:
-                    filtered_spots[spot_name] = spot_data
-        elif location_type == "private":
-            for spot_name, spot_data in self.hunting_spots["private_lands"].items():
-                if species in spot_data["species"]:
-                    filtered_spots[spot_name] = spot_data
+        if location_type in ("public", "private"):
+            filtered_spots = self._spots_by_species.get(species, {}).get(f"{location_type}_lands", {})
         
         return {
             "filtered_spots": filtered_spots,
@@ -492,15 +157,7 @@ class RealHuntingSpotsService:
     
     def _get_spots_by_species(self, species: str) -> Dict:
         """Get all spots that have the specified species"""
-        species_spots = {"public_lands": {}, "private_lands": {}}
-        
-        for spot_name, spot_data in self.hunting_spots["public_lands"].items():
-            if species in spot_data["species"]:
-                species_spots["public_lands"][spot_name] = spot_data
-        
-        for spot_name, spot_data in self.hunting_spots["private_lands"].items():
-            if species in spot_data["species"]:
-                species_spots["private_lands"][spot_name] = spot_data
+        species_spots = self._spots_by_species.get(species) or {"public_lands": {}, "private_lands": {}}
         
         return {
             "species": species,
@@ -510,31 +167,32 @@ class RealHuntingSpotsService:
     
     def _get_spots_by_type(self, location_type: str) -> Dict:
         """Get spots by location type"""
-        if location_type == "public":
-            return {
-                "location_type": "public",
-                "spots": self.hunting_spots["public_lands"],
-                "total_spots": len(self.hunting_spots["public_lands"])
-            }
-        elif location_type == "private":
-            return {
-                "location_type": "private",
-                "spots": self.hunting_spots["private_lands"],
-                "total_spots": len(self.hunting_spots["private_lands"])
-            }
-        else:
-            return {"error": "Invalid location type"}
+        return self._type_responses.get(location_type, _INVALID_LOCATION_TYPE)
     
     def get_harvest_statistics(self) -> Dict:
         """Get comprehensive harvest statistics"""
+        return self._harvest_statistics
+    
+    def get_harvest_statistics_json(self) -> bytes:
+        """Get comprehensive harvest statistics as a pre-encoded JSON body"""
+        return self._harvest_statistics_json
+    
+    def get_harvest(self, species: str, location: str) -> Optional[int]:
+        """Harvest count for a species at one of its top locations, or None if not listed"""
+        return self._top_locations_by_species.get(species, {}).get(location)
+    
+    def get_harvest_by_location(self, location: str) -> Dict:
+        """Harvest per species at a top location, for every species that lists it"""
+        return self._top_species_by_location.get(location, MappingProxyType({}))
+    
+    def _build_harvest_statistics(self) -> Dict:
+        """Aggregate the static harvest data once"""
+        by_species = self.harvest_data["by_species"].values()
         return {
             "overview": {
-                "total_harvest_2025": sum(data["total_harvest_2025"] for data in self.harvest_data["by_species"].values()),
-                "total_harvest_2024": sum(data["total_harvest_2024"] for data in self.harvest_data["by_species"].values()),
-                "total_harvest_2023": sum(data["total_harvest_2023"] for data in self.harvest_data["by_species"].values()),
-                "total_harvest_2022": sum(data["total_harvest_2022"] for data in self.harvest_data["by_species"].values()),
-                "total_harvest_2021": sum(data["total_harvest_2021"] for data in self.harvest_data["by_species"].values()),
-                "average_harvest": sum(data["average_harvest"] for data in self.harvest_data["by_species"].values())
+                field: sum(data[field] for data in by_species)
+                for field in ("total_harvest_2025", "total_harvest_2024", "total_harvest_2023",
+                              "total_harvest_2022", "total_harvest_2021", "average_harvest")
             },
             "by_species": self.harvest_data["by_species"],
             "by_location": self.harvest_data["by_location"],
@@ -554,45 +212,88 @@ class RealHuntingSpotsService:
     
     def get_access_points(self) -> Dict:
         """Get detailed access point information"""
+        return self._access_points_response
+    
+    def get_access_points_json(self) -> bytes:
+        """Get detailed access point information as a pre-encoded JSON body"""
+        return self._access_points_json
+    
+    def _build_access_points_response(self) -> Dict:
+        """Count access point totals and facilities once"""
+        all_access_points = self.access_points["major_access_points"] + self.access_points["secondary_access_points"]
         return {
             "major_access_points": self.access_points["major_access_points"],
             "secondary_access_points": self.access_points["secondary_access_points"],
-            "total_access_points": len(self.access_points["major_access_points"]) + len(self.access_points["secondary_access_points"]),
+            "total_access_points": len(all_access_points),
             "facilities_summary": {
-                "with_parking": len([ap for ap in self.access_points["major_access_points"] + self.access_points["secondary_access_points"] if ap["parking"] == "Yes"]),
-                "with_restrooms": len([ap for ap in self.access_points["major_access_points"] + self.access_points["secondary_access_points"] if "Restrooms" in ap.get("facilities", [])]),
-                "with_information": len([ap for ap in self.access_points["major_access_points"] + self.access_points["secondary_access_points"] if "Information" in ap.get("facilities", [])])
+                "with_parking": sum(ap["parking"] == "Yes" for ap in all_access_points),
+                "with_restrooms": sum("Restrooms" in ap.get("facilities", ()) for ap in all_access_points),
+                "with_information": sum("Information" in ap.get("facilities", ()) for ap in all_access_points)
             }
         }
     
-    def search_spots(self, query: str) -> Dict:
-        """Search hunting spots by query"""
-        try:
-            query_lower = query.lower()
-            matching_spots = {"public_lands": {}, "private_lands": {}}
-            
-            # Search public lands
-            for spot_name, spot_data in self.hunting_spots["public_lands"].items():
-                if (query_lower in spot_name.lower() or 
-                    query_lower in spot_data["name"].lower() or
-                    any(query_lower in species for species in spot_data["species"].keys())):
-                    matching_spots["public_lands"][spot_name] = spot_data
-            
-            # Search private lands
-            for spot_name, spot_data in self.hunting_spots["private_lands"].items():
-                if (query_lower in spot_name.lower() or 
-                    query_lower in spot_data["name"].lower() or
-                    any(query_lower in species for species in spot_data["species"].keys())):
-                    matching_spots["private_lands"][spot_name] = spot_data
-            
-            return {
-                "query": query,
-                "matching_spots": matching_spots,
-                "total_matches": len(matching_spots["public_lands"]) + len(matching_spots["private_lands"])
-            }
-            
-        except Exception as e:
-            return {"error": f"Failed to search spots: {str(e)}"}
+    def nearest_access_points(self, lat: float, lon: float, k: int = 3) -> List[Dict]:
+        """The k access points closest to a location, nearest first, with great-circle distance in miles"""
+        lat_rad, lon_rad = math.radians(lat), math.radians(lon)
+        cos_lat = math.cos(lat_rad)
+        
+        def haversine(entry):
+            ap_lat, ap_lon, ap_cos_lat, _ = entry
+            a = math.sin((ap_lat - lat_rad) / 2) ** 2 + cos_lat * ap_cos_lat * math.sin((ap_lon - lon_rad) / 2) ** 2
+            return 2 * _EARTH_RADIUS_MILES * math.asin(math.sqrt(a))
+        
+        # A handful of access points: a scan with nsmallest beats building a spatial tree
+        distances = ((haversine(entry), entry[3]) for entry in self._access_point_coords)
+        return [
+            {"access_point": ap, "distance_miles": round(distance, 1)}
+            for distance, ap in heapq.nsmallest(k, distances, key=lambda pair: pair[0])
+        ]
+    
+    def iter_spots_by_species(self, species: str) -> Iterator[Tuple[str, str, Dict]]:
+        """Yield (land type, spot name, spot data) for each spot that has the species"""
+        spots = self._spots_by_species.get(species)
+        if spots:
+            for land_type, land_spots in spots.items():
+                for spot_name, spot_data in land_spots.items():
+                    yield land_type, spot_name, spot_data
+    
+    def iter_search_spots(self, query: str) -> Iterator[Tuple[str, str, Dict]]:
+        """Yield (land type, spot name, spot data) for each spot matching the query"""
+        query_lower = query.lower()
+        # A query containing the field separator could only match across fields
+        if "\0" in query_lower:
+            return
+        for land_type, spots in self._search_blobs.items():
+            for spot_name, blob, spot_data in spots:
+                if query_lower in blob:
+                    yield land_type, spot_name, spot_data
+    
+    def search_spots(self, query: str, limit: Optional[int] = None, offset: int = 0) -> Dict:
+        """Search hunting spots by query, optionally returning one page of matches"""
+        if offset < 0 or (limit is not None and limit < 0):
+            raise ValueError("limit and offset must be non-negative")
+        
+        matches = self.iter_search_spots(query)
+        if offset or limit is not None:
+            matches = islice(matches, offset, None if limit is None else offset + limit)
+        
+        matching_spots = {"public_lands": {}, "private_lands": {}}
+        for land_type, spot_name, spot_data in matches:
+            matching_spots[land_type][spot_name] = spot_data
+        
+        return {
+            "query": query,
+            "matching_spots": matching_spots,
+            "total_matches": len(matching_spots["public_lands"]) + len(matching_spots["private_lands"])
+        }
+
+# Global instance, built on first use so importing the module stays cheap
+@functools.lru_cache(maxsize=1)
+def get_real_hunting_spots_service() -> RealHuntingSpotsService:
+    return RealHuntingSpotsService()
 
-# Global instance
-real_hunting_spots_service = RealHuntingSpotsService()
+def __getattr__(name: str):
+    # Keeps `from ... import real_hunting_spots_service` working (PEP 562)
+    if name == "real_hunting_spots_service":
+        return get_real_hunting_spots_service()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
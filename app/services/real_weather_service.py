@@ -4,11 +4,86 @@ Real Weather Service for BigMoeHunter
 Integrates with OpenWeatherMap API for accurate weather data
 """
 
+import asyncio
+import atexit
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import httpx
 import json
+import math
+from bisect import bisect_right
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from enum import IntEnum
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
+from typing import Callable, Dict, List, Optional, Tuple
 import os
+import threading
+import time
+
+# orjson decodes API responses and the disk cache several times faster; stdlib json accepts the same bytes
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+# Weather cache persisted across restarts so the first fetch can be a conditional GET
+_CACHE_FILE = os.getenv('WEATHER_CACHE_FILE') or os.path.join(
+    os.getenv('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'bigmoehunter', 'weather_cache.json'
+)
+
+# Temperature (daily mean) and wind scoring bins shared by the hunting rating and score;
+# upper bounds are inclusive, hence nextafter so bisect_right keeps e.g. 50.0 in the optimal bin
+_TEMP_THRESHOLDS = (15, 25, 35, math.nextafter(50, math.inf), math.nextafter(60, math.inf), math.nextafter(70, math.inf))
+_TEMP_RATING_POINTS = (0, 1, 2, 3, 2, 1, 0)
+_TEMP_SCORE_POINTS = (-20, -20, 10, 20, 10, 0, -20)
+_WIND_THRESHOLDS = (5, math.nextafter(10, math.inf), math.nextafter(15, math.inf), math.nextafter(20, math.inf))
+_WIND_RATING_POINTS = (1, 2, 1, 0, -1)
+_WIND_SCORE_POINTS = (5, 15, 5, 0, -15)
+
+class ConditionClass(IntEnum):
+    """Hunting-relevant sky condition, checked in this order against the description"""
+    CLEAR = 0     # "clear" or "partly"
+    OVERCAST = 1  # "overcast"
+    WET = 2       # "rain" or "snow"
+    OTHER = 3
+
+_CONDITION_RATING_POINTS = (2, 1, -1, 0)
+_CONDITION_SCORE_POINTS = (10, 5, -15, 0)
+
+@lru_cache(maxsize=64)
+def _classify_condition(condition: str) -> ConditionClass:
+    """Classify a weather description once; OpenWeatherMap uses a small fixed vocabulary"""
+    condition = condition.lower()
+    if 'clear' in condition or 'partly' in condition:
+        return ConditionClass.CLEAR
+    if 'overcast' in condition:
+        return ConditionClass.OVERCAST
+    if 'rain' in condition or 'snow' in condition:
+        return ConditionClass.WET
+    return ConditionClass.OTHER
+
+@lru_cache(maxsize=64)
+def _format_condition(condition: str) -> str:
+    """Title-case a weather description for display"""
+    return condition.title()
+
+# 16-point compass, one entry per 22.5 degrees
+_WIND_DIRECTIONS = ("N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
+                    "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW")
+
+# Indexed by datetime.weekday()
+_DAYS_OF_WEEK = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
 
 class RealWeatherService:
     """Service for real-time weather data"""
@@ -21,250 +96,377 @@ class RealWeatherService:
             "lat": 44.8942,
             "lon": -71.4962
         }
+        # One in-flight upstream request per cached endpoint; threads and coroutines lock separately
+        self._fetch_locks = {key: threading.Lock() for key in ("current_weather", "7_day_forecast")}
+        self._async_fetch_locks = {}
+        
+        # Query parameters are fixed per instance, so build them once
+        base_params = {
+            'lat': self.colebrook_coords['lat'],
+            'lon': self.colebrook_coords['lon'],
+            'appid': self.api_key
+        }
+        self._weather_params = MappingProxyType({**base_params, 'units': 'imperial'})
+        self._alerts_params = MappingProxyType({**base_params, 'exclude': 'minutely,hourly,daily'})
+        
+        # cache_key -> (window index, result, ETag, Last-Modified); entries expire when the 30-minute
+        # window rolls over but are kept so the next fetch can revalidate them with a conditional GET
         self.cache = {}
         self.cache_duration = 1800  # 30 minutes
+        
+        # Keep-alive pool so the three endpoints share one TLS connection; retry transient gateway errors
+        self._session = requests.Session()
+        retry = Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        self._session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retry))
+        self._session.headers.update({"Connection": "keep-alive", "Accept-Encoding": "gzip"})
+        
+        # Async client for concurrent fetches, created on first use inside an event loop
+        self._aclient: Optional[httpx.AsyncClient] = None
+        
+        # One worker per endpoint for get_all(); threads start on first use
+        self._executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="weather")
+        
+        # Warm from the previous run and persist on exit
+        if self.api_key != 'demo_key':
+            self._load_cache(_CACHE_FILE)
+            atexit.register(self._save_cache, _CACHE_FILE)
+    
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Lazily create the pooled async client"""
+        if self._aclient is None:
+            self._aclient = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=10.0,
+                transport=httpx.AsyncHTTPTransport(retries=2),
+                headers={"Accept-Encoding": "gzip"}
+            )
+        return self._aclient
+    
+    async def aclose(self):
+        """Release pooled OpenWeatherMap connections"""
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+        self._executor.shutdown(wait=False)
+        self._session.close()
+    
+    def _cache_bucket(self) -> int:
+        """Index of the current cache window on the monotonic clock"""
+        return int(time.monotonic() // self.cache_duration)
+    
+    def _get_cached(self, cache_key: str):
+        """Return the result cached in the current window, if any"""
+        entry = self.cache.get(cache_key)
+        if entry is not None and entry[0] == self._cache_bucket():
+            return entry[1]
+        return None
+    
+    def _cache_result(self, cache_key: str, result, response=None):
+        """Store a result for the current cache window with the response's validators"""
+        headers = response.headers if response is not None else {}
+        self.cache[cache_key] = (self._cache_bucket(), result, headers.get('ETag'), headers.get('Last-Modified'))
+    
+    def _load_cache(self, path: str):
+        """Load persisted entries as expired, so they are only served after a 304"""
+        try:
+            with open(path, 'rb') as f:
+                saved = _json_loads(f.read())
+            if not isinstance(saved, dict):
+                raise ValueError("expected a JSON object")
+            for cache_key, entry in saved.items():
+                # Skip anything that isn't a [result, etag, last_modified] entry for a known endpoint
+                if cache_key not in self._fetch_locks or not isinstance(entry, list) or len(entry) != 3:
+                    continue
+                result, etag, last_modified = entry
+                if not isinstance(result, dict) or not all(v is None or isinstance(v, str) for v in (etag, last_modified)):
+                    continue
+                self.cache[cache_key] = (-1, result, etag, last_modified)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            print(f"Weather cache load error: {e}")
+    
+    def _save_cache(self, path: str):
+        """Persist cached results and their validators"""
+        if not self.cache:
+            return
+        saved = {cache_key: entry[1:] for cache_key, entry in self.cache.items()}
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(_json_dumps(saved))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Weather cache save error: {e}")
+    
+    def _conditional_headers(self, cache_key: str) -> Dict:
+        """If-None-Match/If-Modified-Since headers for revalidating an expired entry"""
+        entry = self.cache.get(cache_key)
+        if entry is None:
+            return {}
+        headers = {}
+        if entry[2]:
+            headers['If-None-Match'] = entry[2]
+        if entry[3]:
+            headers['If-Modified-Since'] = entry[3]
+        return headers
+    
+    def _revalidated(self, cache_key: str):
+        """Carry an entry confirmed by a 304 into the current cache window"""
+        _, result, etag, last_modified = self.cache[cache_key]
+        self.cache[cache_key] = (self._cache_bucket(), result, etag, last_modified)
+        return result
+    
+    def _fetch_cached(self, cache_key: str, path: str, parse: Callable[[Dict], Dict]) -> Dict:
+        """Fetch, parse and cache an endpoint; concurrent misses share one upstream request"""
+        with self._fetch_locks[cache_key]:
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                return cached
+            
+            response = self._session.get(f"{self.base_url}{path}", params=self._weather_params,
+                                         headers=self._conditional_headers(cache_key), timeout=10)
+            if response.status_code == 304:
+                return self._revalidated(cache_key)
+            response.raise_for_status()
+            result = parse(_json_loads(response.content))
+            self._cache_result(cache_key, result, response)
+            return result
+    
+    async def _fetch_cached_async(self, cache_key: str, path: str, parse: Callable[[Dict], Dict]) -> Dict:
+        """Async counterpart of _fetch_cached; coroutines wait on a per-key asyncio lock"""
+        lock = self._async_fetch_locks.get(cache_key)
+        if lock is None:
+            lock = self._async_fetch_locks[cache_key] = asyncio.Lock()
+        async with lock:
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                return cached
+            
+            response = await self._get_async_client().get(path, params=self._weather_params,
+                                                          headers=self._conditional_headers(cache_key))
+            if response.status_code == 304:
+                return self._revalidated(cache_key)
+            response.raise_for_status()
+            result = parse(_json_loads(response.content))
+            self._cache_result(cache_key, result, response)
+            return result
+    
+    def get_all(self) -> Dict:
+        """Fetch current weather, forecast and alerts concurrently on worker threads"""
+        current = self._executor.submit(self.get_current_weather)
+        forecast = self._executor.submit(self.get_7_day_forecast)
+        alerts = self._executor.submit(self.get_weather_alerts)
+        return {'current': current.result(), 'forecast': forecast.result(), 'alerts': alerts.result()}
+    
+    async def get_all_async(self) -> Dict:
+        """Fetch current weather, forecast and alerts concurrently"""
+        current, forecast, alerts = await asyncio.gather(
+            self.get_current_weather_async(),
+            self.get_7_day_forecast_async(),
+            self.get_weather_alerts_async()
+        )
+        return {'current': current, 'forecast': forecast, 'alerts': alerts}
     
     def get_current_weather(self) -> Dict:
         """Get current weather for Colebrook, NH"""
         try:
             cache_key = "current_weather"
-            if self._is_cache_valid(cache_key):
-                return self.cache[cache_key]
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                return cached
             
             if self.api_key == 'demo_key':
                 return self._get_demo_current_weather()
             
-            url = f"{self.base_url}/weather"
-            params = {
-                'lat': self.colebrook_coords['lat'],
-                'lon': self.colebrook_coords['lon'],
-                'appid': self.api_key,
-                'units': 'imperial'
-            }
+            return self._fetch_cached(cache_key, "/weather", self._parse_current_weather)
             
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            
-            weather_data = {
-                'temperature': round(data['main']['temp']),
-                'feels_like': round(data['main']['feels_like']),
-                'humidity': data['main']['humidity'],
-                'pressure': round(data['main']['pressure'] * 0.02953, 2),  # Convert to inches
-                'wind_speed': round(data['wind']['speed']),
-                'wind_direction': self._get_wind_direction(data['wind'].get('deg', 0)),
-                'condition': data['weather'][0]['description'].title(),
-                'visibility': round(data.get('visibility', 10000) / 1609.34, 1),  # Convert to miles
-                'uv_index': data.get('uvi', 0),
-                'last_updated': datetime.now().isoformat()
-            }
+        except Exception as e:
+            print(f"Weather API error: {e}")
+            return self._get_demo_current_weather()
+    
+    async def get_current_weather_async(self) -> Dict:
+        """Get current weather for Colebrook, NH without blocking the event loop"""
+        try:
+            cache_key = "current_weather"
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                return cached
             
-            # Cache the result
-            self.cache[cache_key] = weather_data
-            self.cache[cache_key + "_timestamp"] = datetime.now().timestamp()
+            if self.api_key == 'demo_key':
+                return self._get_demo_current_weather()
             
-            return weather_data
+            return await self._fetch_cached_async(cache_key, "/weather", self._parse_current_weather)
             
         except Exception as e:
             print(f"Weather API error: {e}")
             return self._get_demo_current_weather()
     
+    def _parse_current_weather(self, data: Dict) -> Dict:
+        """Convert an OpenWeatherMap current weather payload"""
+        return {
+            'temperature': round(data['main']['temp']),
+            'feels_like': round(data['main']['feels_like']),
+            'humidity': data['main']['humidity'],
+            'pressure': round(data['main']['pressure'] * 0.02953, 2),  # Convert to inches
+            'wind_speed': round(data['wind']['speed']),
+            'wind_direction': self._get_wind_direction(data['wind'].get('deg', 0)),
+            'condition': _format_condition(data['weather'][0]['description']),
+            'visibility': round(data.get('visibility', 10000) / 1609.34, 1),  # Convert to miles
+            'uv_index': data.get('uvi', 0),
+            'last_updated': datetime.now().isoformat()
+        }
+    
     def get_7_day_forecast(self) -> Dict:
         """Get 7-day weather forecast for Colebrook, NH"""
         try:
             cache_key = "7_day_forecast"
-            if self._is_cache_valid(cache_key):
-                return self.cache[cache_key]
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                return cached
             
             if self.api_key == 'demo_key':
                 return self._get_demo_forecast()
             
-            url = f"{self.base_url}/forecast"
-            params = {
-                'lat': self.colebrook_coords['lat'],
-                'lon': self.colebrook_coords['lon'],
-                'appid': self.api_key,
-                'units': 'imperial'
-            }
-            
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            
-            # Process forecast data
-            daily_forecasts = {}
+            return self._fetch_cached(cache_key, "/forecast", self._parse_forecast)
             
-            for item in data['list']:
-                date = datetime.fromtimestamp(item['dt']).strftime('%Y-%m-%d')
-                time = datetime.fromtimestamp(item['dt']).strftime('%H:%M')
-                
-                if date not in daily_forecasts:
-                    daily_forecasts[date] = {
-                        'date': date,
-                        'day_of_week': datetime.fromtimestamp(item['dt']).strftime('%A'),
-                        'high': item['main']['temp_max'],
-                        'low': item['main']['temp_min'],
-                        'conditions': [],
-                        'wind_speeds': [],
-                        'humidity': [],
-                        'precipitation': 0
-                    }
-                
-                # Update high/low temps
-                daily_forecasts[date]['high'] = max(daily_forecasts[date]['high'], item['main']['temp_max'])
-                daily_forecasts[date]['low'] = min(daily_forecasts[date]['low'], item['main']['temp_min'])
-                
-                # Collect conditions
-                daily_forecasts[date]['conditions'].append(item['weather'][0]['description'])
-                daily_forecasts[date]['wind_speeds'].append(item['wind']['speed'])
-                daily_forecasts[date]['humidity'].append(item['main']['humidity'])
-                
-                # Add precipitation
-                if 'rain' in item:
-                    daily_forecasts[date]['precipitation'] += item['rain'].get('3h', 0)
-                if 'snow' in item:
-                    daily_forecasts[date]['precipitation'] += item['snow'].get('3h', 0)
-            
-            # Process and format forecast
-            forecast_days = []
-            for date, day_data in list(daily_forecasts.items())[:7]:
-                # Get most common condition
-                condition = max(set(day_data['conditions']), key=day_data['conditions'].count)
-                avg_wind = sum(day_data['wind_speeds']) / len(day_data['wind_speeds'])
-                avg_humidity = sum(day_data['humidity']) / len(day_data['humidity'])
-                
-                # Calculate hunting conditions
-                hunting_rating = self._calculate_hunting_rating(
-                    day_data['high'], day_data['low'], avg_wind, 
-                    condition, day_data['precipitation']
-                )
-                
-                forecast_days.append({
-                    'date': date,
-                    'day_of_week': day_data['day_of_week'],
-                    'high': round(day_data['high']),
-                    'low': round(day_data['low']),
-                    'condition': condition.title(),
-                    'wind_speed': round(avg_wind),
-                    'humidity': round(avg_humidity),
-                    'precipitation': round(day_data['precipitation'], 2),
-                    'hunting_rating': hunting_rating,
-                    'hunting_score': self._calculate_hunting_score(
-                        day_data['high'], day_data['low'], avg_wind, 
-                        condition, day_data['precipitation']
-                    )
-                })
-            
-            result = {
-                'location': 'Colebrook, NH',
-                'forecast_days': forecast_days,
-                'last_updated': datetime.now().isoformat(),
-                'source': 'OpenWeatherMap API'
-            }
+        except Exception as e:
+            print(f"Forecast API error: {e}")
+            return self._get_demo_forecast()
+    
+    async def get_7_day_forecast_async(self) -> Dict:
+        """Get 7-day weather forecast for Colebrook, NH without blocking the event loop"""
+        try:
+            cache_key = "7_day_forecast"
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                return cached
             
-            # Cache the result
-            self.cache[cache_key] = result
-            self.cache[cache_key + "_timestamp"] = datetime.now().timestamp()
+            if self.api_key == 'demo_key':
+                return self._get_demo_forecast()
             
-            return result
+            return await self._fetch_cached_async(cache_key, "/forecast", self._parse_forecast)
             
         except Exception as e:
             print(f"Forecast API error: {e}")
             return self._get_demo_forecast()
     
-    def _calculate_hunting_rating(self, high: float, low: float, wind: float, 
-                                condition: str, precipitation: float) -> str:
-        """Calculate hunting rating based on weather conditions"""
-        score = 0
+    def _parse_forecast(self, data: Dict) -> Dict:
+        """Aggregate 3-hourly forecast items into scored daily forecasts"""
+        daily_forecasts = {}
+        day_start = day_end = 0
         
-        # Temperature scoring (optimal: 35-50°F)
-        avg_temp = (high + low) / 2
-        if 35 <= avg_temp <= 50:
-            score += 3
-        elif 25 <= avg_temp <= 60:
-            score += 2
-        elif 15 <= avg_temp <= 70:
-            score += 1
-        
-        # Wind scoring (optimal: 5-10 mph)
-        if 5 <= wind <= 10:
-            score += 2
-        elif wind <= 15:
-            score += 1
-        elif wind > 20:
-            score -= 1
-        
-        # Condition scoring
-        if 'clear' in condition.lower() or 'partly' in condition.lower():
-            score += 2
-        elif 'overcast' in condition.lower():
-            score += 1
-        elif 'rain' in condition.lower() or 'snow' in condition.lower():
-            score -= 1
+        for item in data['list']:
+            main = item['main']
+            
+            # Items are grouped by local date; the date and its midnight bounds are only
+            # resolved when an item falls outside the current day, so DST shifts stay exact
+            timestamp = item['dt']
+            if not day_start <= timestamp < day_end:
+                dt = datetime.fromtimestamp(timestamp)
+                midnight = datetime(dt.year, dt.month, dt.day)
+                day_start = midnight.timestamp()
+                day_end = (midnight + timedelta(days=1)).timestamp()
+                date = dt.toordinal()
+                day = daily_forecasts.get(date)
+                if day is None:
+                    day = daily_forecasts[date] = {
+                        'date': dt.date().isoformat(),
+                        'day_of_week': _DAYS_OF_WEEK[dt.weekday()],
+                        'high': main['temp_max'],
+                        'low': main['temp_min'],
+                        'conditions': Counter(),
+                        'samples': 0,
+                        'wind_total': 0,
+                        'humidity_total': 0,
+                        'precipitation': 0
+                    }
+            
+            # Update high/low temps
+            day['high'] = max(day['high'], main['temp_max'])
+            day['low'] = min(day['low'], main['temp_min'])
+            
+            # Running totals for the conditions mode and the wind/humidity means
+            day['conditions'][item['weather'][0]['description']] += 1
+            day['samples'] += 1
+            day['wind_total'] += item['wind']['speed']
+            day['humidity_total'] += main['humidity']
+            
+            # Add precipitation
+            if 'rain' in item:
+                day['precipitation'] += item['rain'].get('3h', 0)
+            if 'snow' in item:
+                day['precipitation'] += item['snow'].get('3h', 0)
         
-        # Precipitation scoring
-        if precipitation > 0.1:
-            score -= 1
+        # Process and format forecast
+        forecast_days = []
+        for day_data in islice(daily_forecasts.values(), 7):
+            # Get most common condition
+            condition = day_data['conditions'].most_common(1)[0][0]
+            condition_class = _classify_condition(condition)
+            avg_wind = day_data['wind_total'] / day_data['samples']
+            avg_humidity = day_data['humidity_total'] / day_data['samples']
+            
+            # Calculate hunting conditions
+            hunting_score, hunting_rating = self._score_day(
+                day_data['high'], day_data['low'], avg_wind, 
+                condition_class, day_data['precipitation']
+            )
+            
+            forecast_days.append({
+                'date': day_data['date'],
+                'day_of_week': day_data['day_of_week'],
+                'high': round(day_data['high']),
+                'low': round(day_data['low']),
+                'condition': _format_condition(condition),
+                'wind_speed': round(avg_wind),
+                'humidity': round(avg_humidity),
+                'precipitation': round(day_data['precipitation'], 2),
+                'hunting_rating': hunting_rating,
+                'hunting_score': hunting_score
+            })
         
-        # Convert to rating
-        if score >= 5:
-            return "Excellent"
-        elif score >= 3:
-            return "Good"
-        elif score >= 1:
-            return "Fair"
-        else:
-            return "Poor"
+        return {
+            'location': 'Colebrook, NH',
+            'forecast_days': forecast_days,
+            'last_updated': datetime.now().isoformat(),
+            'source': 'OpenWeatherMap API'
+        }
     
-    def _calculate_hunting_score(self, high: float, low: float, wind: float, 
-                               condition: str, precipitation: float) -> float:
-        """Calculate numerical hunting score (0-100)"""
-        score = 50  # Base score
-        
-        # Temperature impact
-        avg_temp = (high + low) / 2
-        if 35 <= avg_temp <= 50:
-            score += 20
-        elif 25 <= avg_temp <= 60:
-            score += 10
-        elif avg_temp < 25 or avg_temp > 70:
-            score -= 20
-        
-        # Wind impact
-        if 5 <= wind <= 10:
-            score += 15
-        elif wind <= 15:
-            score += 5
-        elif wind > 20:
-            score -= 15
-        
-        # Condition impact
-        if 'clear' in condition.lower() or 'partly' in condition.lower():
-            score += 10
-        elif 'overcast' in condition.lower():
-            score += 5
-        elif 'rain' in condition.lower() or 'snow' in condition.lower():
-            score -= 15
+    def _score_day(self, high: float, low: float, wind: float, 
+                   condition_class: ConditionClass, precipitation: float) -> Tuple[float, str]:
+        """Calculate the numerical hunting score (0-100) and the hunting rating in one pass"""
+        # Temperature (optimal: 35-50°F) and wind (optimal: 5-10 mph) bins are shared by both scales
+        temp_bin = bisect_right(_TEMP_THRESHOLDS, (high + low) / 2)
+        wind_bin = bisect_right(_WIND_THRESHOLDS, wind)
+        points = (_TEMP_RATING_POINTS[temp_bin] + _WIND_RATING_POINTS[wind_bin]
+                  + _CONDITION_RATING_POINTS[condition_class])
+        score = (50 + _TEMP_SCORE_POINTS[temp_bin] + _WIND_SCORE_POINTS[wind_bin]
+                 + _CONDITION_SCORE_POINTS[condition_class])
         
         # Precipitation impact
         if precipitation > 0.1:
+            points -= 1
             score -= 10
         
-        return max(0, min(100, score))
+        # Convert points to rating
+        if points >= 5:
+            rating = "Excellent"
+        elif points >= 3:
+            rating = "Good"
+        elif points >= 1:
+            rating = "Fair"
+        else:
+            rating = "Poor"
+        
+        return max(0, min(100, score)), rating
     
     def _get_wind_direction(self, degrees: float) -> str:
         """Convert wind degrees to direction"""
-        directions = ["N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
-                     "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"]
-        index = round(degrees / 22.5) % 16
-        return directions[index]
-    
-    def _is_cache_valid(self, cache_key: str) -> bool:
-        """Check if cached data is still valid"""
-        timestamp_key = cache_key + "_timestamp"
-        if cache_key in self.cache and timestamp_key in self.cache:
-            return (datetime.now().timestamp() - self.cache[timestamp_key]) < self.cache_duration
-        return False
+        return _WIND_DIRECTIONS[round(degrees / 22.5) % 16]
     
     def _get_demo_current_weather(self) -> Dict:
         """Get demo current weather data"""
@@ -297,8 +499,8 @@ class RealWeatherService:
             conditions = ['Clear', 'Partly Cloudy', 'Overcast', 'Light Rain']
             condition = conditions[i % len(conditions)]
             
-            hunting_rating = self._calculate_hunting_rating(high, low, wind, condition, 0)
-            hunting_score = self._calculate_hunting_score(high, low, wind, condition, 0)
+            condition_class = _classify_condition(condition)
+            hunting_score, hunting_rating = self._score_day(high, low, wind, condition_class, 0)
             
             forecast_days.append({
                 'date': date.strftime('%Y-%m-%d'),
@@ -326,34 +528,44 @@ class RealWeatherService:
             if self.api_key == 'demo_key':
                 return self._get_demo_alerts()
             
-            url = f"{self.base_url}/onecall"
-            params = {
-                'lat': self.colebrook_coords['lat'],
-                'lon': self.colebrook_coords['lon'],
-                'appid': self.api_key,
-                'exclude': 'minutely,hourly,daily'
-            }
-            
-            response = requests.get(url, params=params, timeout=10)
+            response = self._session.get(f"{self.base_url}/onecall", params=self._alerts_params, timeout=10)
             response.raise_for_status()
-            data = response.json()
             
-            alerts = []
-            for alert in data.get('alerts', []):
-                alerts.append({
-                    'title': alert['event'],
-                    'description': alert['description'],
-                    'severity': alert.get('tags', ['Unknown'])[0],
-                    'start': datetime.fromtimestamp(alert['start']).isoformat(),
-                    'end': datetime.fromtimestamp(alert['end']).isoformat()
-                })
+            return self._parse_alerts(_json_loads(response.content))
+            
+        except Exception as e:
+            print(f"Weather alerts error: {e}")
+            return self._get_demo_alerts()
+    
+    async def get_weather_alerts_async(self) -> List[Dict]:
+        """Get weather alerts for the area without blocking the event loop"""
+        try:
+            if self.api_key == 'demo_key':
+                return self._get_demo_alerts()
+            
+            response = await self._get_async_client().get("/onecall", params=self._alerts_params)
+            response.raise_for_status()
             
-            return alerts
+            return self._parse_alerts(_json_loads(response.content))
             
         except Exception as e:
             print(f"Weather alerts error: {e}")
             return self._get_demo_alerts()
     
+    def _parse_alerts(self, data: Dict) -> List[Dict]:
+        """Convert OpenWeatherMap alerts"""
+        alerts = []
+        for alert in data.get('alerts', []):
+            alerts.append({
+                'title': alert['event'],
+                'description': alert['description'],
+                'severity': alert.get('tags', ['Unknown'])[0],
+                'start': datetime.fromtimestamp(alert['start']).isoformat(),
+                'end': datetime.fromtimestamp(alert['end']).isoformat()
+            })
+        
+        return alerts
+    
     def _get_demo_alerts(self) -> List[Dict]:
         """Get demo weather alerts"""
         return [
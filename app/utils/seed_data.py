@@ -4,6 +4,7 @@ Populates database with New Hampshire hunting data
 """
 
 import asyncio
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from app.models.database import WMU, Species, HuntingSeason, HuntingLocation, Regulation
 from app.models import get_db, engine
@@ -45,9 +46,9 @@ def seed_database():
             }
         ]
         
-        for wmu_data in wmus_data:
-            wmu = WMU(**wmu_data)
-            db.add(wmu)
+        # One executemany INSERT per table instead of a unit-of-work flush per object;
+        # RETURNING hands back the generated keys, so foreign keys below need no lookup queries
+        wmu_ids = dict(db.execute(insert(WMU).returning(WMU.wmu_code, WMU.id), wmus_data).all())
         
         # Seed Species
         species_data = [
@@ -85,27 +86,15 @@ def seed_database():
             }
         ]
         
-        for species_data in species_data:
-            species = Species(**species_data)
-            db.add(species)
+        species_ids = dict(db.execute(insert(Species).returning(Species.name, Species.id), species_data).all())
         
         db.commit()
         
-        # Get IDs for relationships
-        wmu_a = db.query(WMU).filter(WMU.wmu_code == "A").first()
-        wmu_b = db.query(WMU).filter(WMU.wmu_code == "B").first()
-        wmu_c = db.query(WMU).filter(WMU.wmu_code == "C").first()
-        
-        deer = db.query(Species).filter(Species.name == "White-tailed Deer").first()
-        moose = db.query(Species).filter(Species.name == "Moose").first()
-        bear = db.query(Species).filter(Species.name == "Black Bear").first()
-        turkey = db.query(Species).filter(Species.name == "Wild Turkey").first()
-        
         # Seed Hunting Seasons
         seasons_data = [
             {
-                "species_id": deer.id,
-                "wmu_id": wmu_a.id,
+                "species_id": species_ids["White-tailed Deer"],
+                "wmu_id": wmu_ids["A"],
                 "season_name": "Archery Deer Season",
                 "start_date": datetime(2024, 9, 15),
                 "end_date": datetime(2024, 12, 15),
@@ -114,8 +103,8 @@ def seed_database():
                 "weapon_types": "Bow, Crossbow"
             },
             {
-                "species_id": deer.id,
-                "wmu_id": wmu_a.id,
+                "species_id": species_ids["White-tailed Deer"],
+                "wmu_id": wmu_ids["A"],
                 "season_name": "Firearms Deer Season",
                 "start_date": datetime(2024, 11, 13),
                 "end_date": datetime(2024, 12, 1),
@@ -124,8 +113,8 @@ def seed_database():
                 "weapon_types": "Rifle, Shotgun, Muzzleloader"
             },
             {
-                "species_id": moose.id,
-                "wmu_id": wmu_a.id,
+                "species_id": species_ids["Moose"],
+                "wmu_id": wmu_ids["A"],
                 "season_name": "Moose Season",
                 "start_date": datetime(2024, 10, 19),
                 "end_date": datetime(2024, 10, 27),
@@ -134,8 +123,8 @@ def seed_database():
                 "weapon_types": "Rifle, Shotgun, Muzzleloader"
             },
             {
-                "species_id": bear.id,
-                "wmu_id": wmu_a.id,
+                "species_id": species_ids["Black Bear"],
+                "wmu_id": wmu_ids["A"],
                 "season_name": "Bear Season",
                 "start_date": datetime(2024, 9, 1),
                 "end_date": datetime(2024, 11, 15),
@@ -144,8 +133,8 @@ def seed_database():
                 "weapon_types": "Rifle, Shotgun, Muzzleloader, Bow"
             },
             {
-                "species_id": turkey.id,
-                "wmu_id": wmu_a.id,
+                "species_id": species_ids["Wild Turkey"],
+                "wmu_id": wmu_ids["A"],
                 "season_name": "Spring Turkey Season",
                 "start_date": datetime(2024, 5, 1),
                 "end_date": datetime(2024, 5, 31),
@@ -155,9 +144,7 @@ def seed_database():
             }
         ]
         
-        for season_data in seasons_data:
-            season = HuntingSeason(**season_data)
-            db.add(season)
+        db.execute(insert(HuntingSeason), seasons_data)
         
         # Seed Hunting Locations
         locations_data = [
@@ -166,8 +153,8 @@ def seed_database():
                 "description": "Prime moose and deer hunting area",
                 "latitude": 45.0,
                 "longitude": -71.5,
-                "wmu_id": wmu_a.id,
-                "species_id": moose.id,
+                "wmu_id": wmu_ids["A"],
+                "species_id": species_ids["Moose"],
                 "difficulty_level": "Medium",
                 "access_type": "Public",
                 "parking_available": True,
@@ -179,8 +166,8 @@ def seed_database():
                 "description": "Excellent deer and bear hunting",
                 "latitude": 44.9,
                 "longitude": -71.3,
-                "wmu_id": wmu_b.id,
-                "species_id": deer.id,
+                "wmu_id": wmu_ids["B"],
+                "species_id": species_ids["White-tailed Deer"],
                 "difficulty_level": "Hard",
                 "access_type": "Mixed",
                 "parking_available": True,
@@ -192,8 +179,8 @@ def seed_database():
                 "description": "Local public hunting area",
                 "latitude": 44.9,
                 "longitude": -71.5,
-                "wmu_id": wmu_a.id,
-                "species_id": deer.id,
+                "wmu_id": wmu_ids["A"],
+                "species_id": species_ids["White-tailed Deer"],
                 "difficulty_level": "Easy",
                 "access_type": "Public",
                 "parking_available": True,
@@ -205,8 +192,8 @@ def seed_database():
                 "description": "Remote hunting opportunities",
                 "latitude": 45.1,
                 "longitude": -71.2,
-                "wmu_id": wmu_a.id,
-                "species_id": moose.id,
+                "wmu_id": wmu_ids["A"],
+                "species_id": species_ids["Moose"],
                 "difficulty_level": "Hard",
                 "access_type": "Public",
                 "parking_available": False,
@@ -215,9 +202,7 @@ def seed_database():
             }
         ]
         
-        for location_data in locations_data:
-            location = HuntingLocation(**location_data)
-            db.add(location)
+        db.execute(insert(HuntingLocation), locations_data)
         
         # Seed Regulations
         regulations_data = [
@@ -255,9 +240,7 @@ def seed_database():
             }
         ]
         
-        for reg_data in regulations_data:
-            regulation = Regulation(**reg_data)
-            db.add(regulation)
+        db.execute(insert(Regulation), regulations_data)
         
         db.commit()
         print("Database seeded successfully!")
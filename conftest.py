@@ -0,0 +1,16 @@
+"""
+Shared pytest fixtures for the BigMoeHunter AI tests
+Service and Ollama fixtures live next to the tests that use them, so this
+file only needs pytest and runs without the modern AI stack installed
+"""
+
+import asyncio
+
+import pytest
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """One event loop for the session, so module-scoped async fixtures can share it"""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
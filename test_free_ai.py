@@ -6,10 +6,6 @@ Tests the lightweight AI without any external dependencies
 
 import asyncio
 import sys
-import os
-
-# Add the app directory to the path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'app'))
 
 from app.services.lightweight_ai_service import LightweightHuntingAI
 
@@ -5,16 +5,81 @@ Tests the cutting-edge Llama 3.1 AI via Ollama
 """
 
 import asyncio
-import sys
 import os
+import sys
+import time
 
-# Add the app directory to the path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'app'))
+import pytest
+import pytest_asyncio
 
 from app.services.modern_ai_service import ModernHuntingAI
 
-async def test_modern_ai():
-    """Test the modern AI service"""
+# uvloop is an optional drop-in event loop with lower per-task overhead (Linux/macOS)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Test data
+LOCATION = "Colebrook, NH"
+SPECIES = "White-tailed Deer"
+WEATHER_DATA = {
+    "temperature": 45,
+    "wind_speed": 8,
+    "wind_direction": 315,
+    "barometric_pressure": 30.15,
+    "humidity": 65,
+    "precipitation": 0
+}
+WEATHER_BANNER = f"{WEATHER_DATA['temperature']}°F, {WEATHER_DATA['wind_speed']} mph winds"
+
+@pytest_asyncio.fixture(scope="module")
+async def ai():
+    """Modern AI service; the live tests are skipped when Ollama is down unless RUN_LIVE_AI=1"""
+    service = ModernHuntingAI()
+    if not service.ollama_available and os.getenv("RUN_LIVE_AI") != "1":
+        await service.aclose()
+        pytest.skip("Ollama not available (set RUN_LIVE_AI=1 to test the fallback system)")
+    yield service
+    await service.aclose()
+
+@pytest.mark.asyncio
+async def test_hunting_recommendation(ai):
+    """The recommendation carries text, a confidence score and its model"""
+    recommendation = await ai.get_hunting_recommendation(
+        location=LOCATION,
+        species=SPECIES,
+        weather_data=WEATHER_DATA,
+        user_preferences={"experience_level": "intermediate"}
+    )
+    assert recommendation['recommendation']
+    assert 0 <= recommendation['confidence_score'] <= 1
+    assert recommendation['ai_model']
+    assert recommendation['generated_at']
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("species", ["Moose", "White-tailed Deer", "Black Bear"])
+async def test_species_specific_advice(ai, species):
+    """Species advice is non-empty for each big-game species"""
+    species_advice = await ai.get_species_specific_advice(species, LOCATION)
+    assert species_advice['advice']
+
+@pytest.mark.asyncio
+async def test_weather_impact_analysis(ai):
+    """Weather analysis reports its model and a confidence"""
+    weather_analysis = await ai.analyze_weather_impact(WEATHER_DATA, SPECIES)
+    assert weather_analysis['analysis']
+    assert weather_analysis['ai_model']
+    assert 0 <= weather_analysis['confidence'] <= 1
+
+@pytest.mark.asyncio
+async def test_streamed_recommendation(ai):
+    """Streaming yields recommendation text"""
+    fragments = [fragment async for fragment in ai.stream_hunting_recommendation(LOCATION, SPECIES, WEATHER_DATA)]
+    assert "".join(fragments).strip()
+
+async def run_modern_ai():
+    """Test the modern AI service, printing a report; True if it passed, False if it failed, None if skipped"""
     print("🤖 Testing BigMoeHunter Modern AI Service")
     print("=" * 50)
     
@@ -22,37 +87,45 @@ async def test_modern_ai():
     ai = ModernHuntingAI()
     print("✅ Modern AI Service initialized")
     
+    try:
+        return await _run_modern_ai(ai)
+    finally:
+        await ai.aclose()
+
+async def _run_modern_ai(ai: ModernHuntingAI):
+    """Run the live AI calls against an initialized service"""
     if ai.ollama_available:
         print("🚀 Ollama + Llama 3.1 is available!")
         print("   This is cutting-edge AI technology!")
+    elif os.getenv("RUN_LIVE_AI") != "1":
+        # The fallback paths aren't what this test checks; RUN_LIVE_AI=1 exercises them anyway
+        print("⚠️ Ollama not available - run ./setup_modern_ai.sh to install modern AI")
+        print("⏭ Skipping live AI calls (set RUN_LIVE_AI=1 to test the fallback system)")
+        return None
     else:
         print("⚠️ Ollama not available - will use fallback system")
         print("   Run ./setup_modern_ai.sh to install modern AI")
     
-    # Test data
-    location = "Colebrook, NH"
-    species = "White-tailed Deer"
-    weather_data = {
-        "temperature": 45,
-        "wind_speed": 8,
-        "wind_direction": 315,
-        "barometric_pressure": 30.15,
-        "humidity": 65,
-        "precipitation": 0
-    }
+    location = LOCATION
+    species = SPECIES
+    weather_data = WEATHER_DATA
     
     print(f"\n📍 Location: {location}")
     print(f"🦌 Species: {species}")
-    print(f"🌤️ Weather: {weather_data['temperature']}°F, {weather_data['wind_speed']} mph winds")
+    print(f"🌤️ Weather: {WEATHER_BANNER}")
     
-    # Get AI recommendation
-    print("\n🤖 Getting modern AI recommendation...")
+    # Run the three requests together so Ollama can serve them in the same batch window
+    print("\n🤖 Getting modern AI recommendation, species advice and weather analysis...")
     try:
-        recommendation = await ai.get_hunting_recommendation(
-            location=location,
-            species=species,
-            weather_data=weather_data,
-            user_preferences={"experience_level": "intermediate"}
+        recommendation, species_advice, weather_analysis = await asyncio.gather(
+            ai.get_hunting_recommendation(
+                location=location,
+                species=species,
+                weather_data=weather_data,
+                user_preferences={"experience_level": "intermediate"}
+            ),
+            ai.get_species_specific_advice("Moose", "Colebrook, NH"),
+            ai.analyze_weather_impact(weather_data, "White-tailed Deer")
         )
         
         print("✅ AI recommendation generated successfully!")
@@ -68,20 +141,32 @@ async def test_modern_ai():
         print(recommendation['recommendation'])
         print("-" * 50)
         
-        # Test species-specific advice
-        print("\n🦌 Testing advanced species-specific advice...")
-        species_advice = await ai.get_species_specific_advice("Moose", "Colebrook, NH")
+        # Species-specific advice
+        print("\n🦌 Advanced species-specific advice:")
         print("✅ Advanced species advice generated!")
         if isinstance(species_advice, dict) and 'advice' in species_advice:
             print(f"Advice: {species_advice['advice'][:200]}...")
         
-        # Test weather impact analysis
-        print("\n🌤️ Testing advanced weather impact analysis...")
-        weather_analysis = await ai.analyze_weather_impact(weather_data, "White-tailed Deer")
+        # Weather impact analysis
+        print("\n🌤️ Advanced weather impact analysis:")
         print("✅ Advanced weather analysis generated!")
         print(f"AI Model: {weather_analysis.get('ai_model', 'Unknown')}")
         print(f"Confidence: {weather_analysis.get('confidence', 'Unknown')}")
         
+        # Streaming recommendation, printed as Llama 3.1 generates it
+        print("\n📡 Testing streamed recommendation...")
+        print("-" * 50)
+        started = time.monotonic()
+        first_token_at = None
+        streamed = []
+        async for fragment in ai.stream_hunting_recommendation(location, species, weather_data):
+            if first_token_at is None:
+                first_token_at = time.monotonic() - started
+            streamed.append(fragment)
+            print(fragment, end="", flush=True)
+        print("\n" + "-" * 50)
+        print(f"✅ Streamed {len(''.join(streamed))} characters, first text after {first_token_at:.2f}s")
+        
         print("\n🎉 All modern AI tests passed!")
         return True
         
@@ -89,26 +174,36 @@ async def test_modern_ai():
         print(f"❌ Error testing modern AI service: {e}")
         return False
 
+_SUCCESS_SUMMARY = "\n".join([
+    "\n✅ BigMoeHunter Modern AI Service is working!",
+    "🚀 You now have cutting-edge AI capabilities!",
+    "🤖 Features:",
+    "   • Llama 3.1 8B model (state-of-the-art)",
+    "   • Natural language understanding",
+    "   • Context-aware recommendations",
+    "   • Multi-factor analysis",
+    "   • 95% confidence scores",
+    "   • Completely free and local",
+    "   • No API keys required",
+    "\n🎯 Perfect for your father's hunting needs!"
+])
+
 async def main():
     """Main test function"""
-    success = await test_modern_ai()
+    success = await run_modern_ai()
     
-    if success:
-        print("\n✅ BigMoeHunter Modern AI Service is working!")
-        print("🚀 You now have cutting-edge AI capabilities!")
-        print("🤖 Features:")
-        print("   • Llama 3.1 8B model (state-of-the-art)")
-        print("   • Natural language understanding")
-        print("   • Context-aware recommendations")
-        print("   • Multi-factor analysis")
-        print("   • 95% confidence scores")
-        print("   • Completely free and local")
-        print("   • No API keys required")
-        print("\n🎯 Perfect for your father's hunting needs!")
+    if success is None:
+        print("\n⏭ Modern AI tests skipped - Ollama is not available.")
+        print("💡 Run ./setup_modern_ai.sh, or set RUN_LIVE_AI=1 to test the fallback system")
+    elif success:
+        print(_SUCCESS_SUMMARY)
     else:
         print("\n❌ Tests failed. Check the implementation.")
         print("💡 Try running: ./setup_modern_ai.sh")
         sys.exit(1)
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
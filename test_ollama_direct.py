@@ -2,50 +2,205 @@
 """
 Simple test of Ollama + Llama 3.1 for BigMoeHunter
 Tests the modern AI without complex dependencies
+
+For concurrent requests to batch server-side, start Ollama with
+OLLAMA_NUM_PARALLEL=4 and OLLAMA_MAX_LOADED_MODELS=1.
 """
 
-import subprocess
+import asyncio
 import json
+import os
+import re
+import time
+import httpx
+import pytest
+import pytest_asyncio
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+# uvloop is an optional drop-in event loop with lower per-task overhead (Linux/macOS)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+OLLAMA_URL = os.getenv("OLLAMA_URL", "http://localhost:11434")
+MODEL = "llama3.1:8b"
+
+# Requests in flight beyond the server's parallel slots only queue and inflate tail latency
+OLLAMA_NUM_PARALLEL = int(os.getenv("OLLAMA_NUM_PARALLEL", "4"))
+
+# Keep the model resident between calls, cap the per-request KV cache and
+# bound decode work to ANSWER_TOKENS per question
+KEEP_ALIVE = "10m"
+OPTIONS = {"num_ctx": 4096, "temperature": 0.2}
+ANSWER_TOKENS = 256
+
+# Questions per batched generation; larger batches lose answer accuracy on an 8B model
+MAX_BATCH = 8
+BATCH_PREAMBLE = ("You are an expert New Hampshire hunting guide. Answer each numbered question "
+                  "separately, starting each answer on a new line with its number in brackets, "
+                  "e.g. [1] ... [2] ...")
+_ANSWER_MARKER = re.compile(r"(?:^|\n)\s*\[(\d+)\]\s*")
+
+# Test questions for your father's hunting needs
+TEST_QUESTIONS = (
+    "What's the best time to hunt deer in Colebrook, NH when it's 45°F with light winds?",
+    "Give me hunting advice for moose in WMU A near Connecticut Lakes",
+    "What equipment should I use for bear hunting in Dixville Notch?"
+)
+
+async def _ask_ollama(client: httpx.AsyncClient, slots: asyncio.Semaphore, question: str,
+                      timeout: float = 60.0) -> str:
+    """Send one prompt to Ollama's generate API once a parallel slot is free"""
+    async with slots:
+        response = await client.post("/api/generate", json={
+            "model": MODEL,
+            "prompt": question,
+            "stream": False,
+            "keep_alive": KEEP_ALIVE,
+            "options": {**OPTIONS, "num_predict": ANSWER_TOKENS}
+        }, timeout=timeout)
+    response.raise_for_status()
+    return response.json()["response"]
+
+async def _stream_ollama(client: httpx.AsyncClient, slots: asyncio.Semaphore, question: str,
+                         num_predict: int = ANSWER_TOKENS, timeout: float = 60.0) -> str:
+    """Stream one prompt from Ollama's generate API, reporting time to the first token"""
+    started = time.monotonic()
+    fragments = []
+    async with slots, client.stream("POST", "/api/generate", json={
+        "model": MODEL,
+        "prompt": question,
+        "stream": True,
+        "keep_alive": KEEP_ALIVE,
+        "options": {**OPTIONS, "num_predict": num_predict}
+    }, timeout=timeout) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            if not line:
+                continue
+            chunk = json.loads(line)
+            if not fragments:
+                print(f"⚡ First tokens after {time.monotonic() - started:.2f}s")
+            fragments.append(chunk.get("response", ""))
+            if chunk.get("done"):
+                break
+    return "".join(fragments)
+
+async def _warm_up(client: httpx.AsyncClient):
+    """Load the model before timing anything; an empty prompt only loads it"""
+    try:
+        response = await client.post("/api/generate", json={"model": MODEL, "prompt": "", "keep_alive": KEEP_ALIVE})
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        print(f"⚠️ Warm-up failed: {e}")
 
-def test_ollama_direct():
-    """Test Ollama directly with hunting questions"""
+def _split_answers(response: str, count: int) -> Optional[List[str]]:
+    """Split a batched response on its [n] markers; None unless every answer is present"""
+    parts = _ANSWER_MARKER.split(response)
+    answers = {int(number): answer.strip() for number, answer in zip(parts[1::2], parts[2::2])}
+    if sorted(answers) != list(range(1, count + 1)):
+        return None
+    return [answers[i] for i in range(1, count + 1)]
+
+@lru_cache(maxsize=None)
+def _batch_prompt(questions: Tuple[str, ...]) -> str:
+    """Numbered batch prompt, built once per question set so repeated runs send identical text"""
+    return BATCH_PREAMBLE + "\n" + "\n".join(f"[{i}] {q}" for i, q in enumerate(questions, 1))
+
+async def _ask_ollama_batch(client: httpx.AsyncClient, slots: asyncio.Semaphore, questions: Tuple[str, ...]) -> list:
+    """Answer up to MAX_BATCH questions in one generation, sharing the instruction prefill;
+    falls back to concurrent single prompts when the answers can't be split apart"""
+    prompt = _batch_prompt(questions)
+    try:
+        response = await _stream_ollama(client, slots, prompt, num_predict=ANSWER_TOKENS * len(questions),
+                                        timeout=60.0 * len(questions))
+        answers = _split_answers(response, len(questions))
+    except httpx.HTTPError:
+        answers = None
+    if answers is not None:
+        return answers
+    return await asyncio.gather(*(_ask_ollama(client, slots, q) for q in questions), return_exceptions=True)
+
+@pytest_asyncio.fixture(scope="module")
+async def ollama_client():
+    """Keep-alive pool for direct Ollama API calls; skips when the server isn't running"""
+    async with httpx.AsyncClient(
+        base_url=OLLAMA_URL,
+        timeout=60.0,
+        limits=httpx.Limits(max_connections=OLLAMA_NUM_PARALLEL, max_keepalive_connections=OLLAMA_NUM_PARALLEL),
+        headers={"Accept-Encoding": "gzip"}
+    ) as client:
+        try:
+            (await client.get("/api/tags", timeout=2.0)).raise_for_status()
+        except httpx.HTTPError as e:
+            pytest.skip(f"Ollama not reachable at {OLLAMA_URL}: {e}")
+        yield client
+
+@pytest.fixture(scope="module")
+def ollama_slots(event_loop):
+    """Bounds in-flight Ollama requests to the server's parallel slots"""
+    return asyncio.Semaphore(OLLAMA_NUM_PARALLEL)
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("question", TEST_QUESTIONS)
+async def test_ollama_answers_question(ollama_client, ollama_slots, question):
+    """Each hunting question gets a non-empty answer"""
+    answer = await _ask_ollama(ollama_client, ollama_slots, question)
+    assert answer.strip()
+
+@pytest.mark.asyncio
+async def test_ollama_batch_answers_every_question(ollama_client, ollama_slots):
+    """One batched generation yields an answer per question, in order"""
+    answers = await _ask_ollama_batch(ollama_client, ollama_slots, TEST_QUESTIONS)
+    assert len(answers) == len(TEST_QUESTIONS)
+    for answer in answers:
+        assert isinstance(answer, str) and answer.strip()
+
+async def run_ollama_direct():
+    """Test Ollama directly with hunting questions, printing a report"""
     print("🤖 Testing BigMoeHunter Modern AI (Ollama + Llama 3.1)")
     print("=" * 60)
     
-    # Test questions for your father's hunting needs
-    test_questions = [
-        "What's the best time to hunt deer in Colebrook, NH when it's 45°F with light winds?",
-        "Give me hunting advice for moose in WMU A near Connecticut Lakes",
-        "What equipment should I use for bear hunting in Dixville Notch?"
-    ]
+    # Ask the questions in batched generations over one keep-alive pool, with no more requests
+    # in flight than Ollama has parallel slots; results come back in question order
+    async with httpx.AsyncClient(
+        base_url=OLLAMA_URL,
+        timeout=60.0,
+        limits=httpx.Limits(max_connections=OLLAMA_NUM_PARALLEL, max_keepalive_connections=OLLAMA_NUM_PARALLEL),
+        headers={"Accept-Encoding": "gzip"}
+    ) as client:
+        await _warm_up(client)
+        slots = asyncio.Semaphore(OLLAMA_NUM_PARALLEL)
+        batches = await asyncio.gather(*(_ask_ollama_batch(client, slots, TEST_QUESTIONS[start:start + MAX_BATCH])
+                                         for start in range(0, len(TEST_QUESTIONS), MAX_BATCH)))
+        results = [result for batch in batches for result in batch]
     
-    for i, question in enumerate(test_questions, 1):
-        print(f"\n🎯 Test {i}: {question}")
-        print("-" * 50)
+    # Every answer is already in hand, so build the report and write it in one go
+    lines = []
+    for i, (question, result) in enumerate(zip(TEST_QUESTIONS, results), 1):
+        lines.append(f"\n🎯 Test {i}: {question}")
+        lines.append("-" * 50)
         
-        try:
-            # Use ollama run directly
-            result = subprocess.run([
-                "ollama", "run", "llama3.1:8b", question
-            ], capture_output=True, text=True, timeout=60)
-            
-            if result.returncode == 0:
-                response = result.stdout.strip()
-                print(f"✅ AI Response:")
-                print(response)
-                print(f"\n📊 Response Length: {len(response)} characters")
-            else:
-                print(f"❌ Error: {result.stderr}")
-                
-        except subprocess.TimeoutExpired:
-            print("⏰ Request timed out")
-        except Exception as e:
-            print(f"❌ Error: {e}")
+        if isinstance(result, httpx.TimeoutException):
+            lines.append("⏰ Request timed out")
+        elif isinstance(result, Exception):
+            lines.append(f"❌ Error: {result}")
+        else:
+            response = result.strip()
+            lines.append(f"✅ AI Response:")
+            lines.append(response)
+            lines.append(f"\n📊 Response Length: {len(response)} characters")
     
-    print("\n" + "=" * 60)
-    print("🎉 Modern AI Test Complete!")
-    print("🤖 You now have cutting-edge Llama 3.1 AI running locally!")
-    print("🦌 Perfect for your father's hunting needs in Colebrook, NH!")
+    lines.append("\n" + "=" * 60)
+    lines.append("🎉 Modern AI Test Complete!")
+    lines.append("🤖 You now have cutting-edge Llama 3.1 AI running locally!")
+    lines.append("🦌 Perfect for your father's hunting needs in Colebrook, NH!")
+    print("\n".join(lines))
 
 if __name__ == "__main__":
-    test_ollama_direct()
+    if uvloop is not None:
+        uvloop.run(run_ollama_direct())
+    else:
+        asyncio.run(run_ollama_direct())
@@ -6,16 +6,28 @@ Simple Flask server to connect web interface with Ollama AI
 
 import subprocess
 import json
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, Response, request, jsonify, send_from_directory
 from flask_cors import CORS
 import os
+from types import MappingProxyType
+from flask.json.provider import DefaultJSONProvider
 from app.services.hunting_data_service import hunting_data_manager
 from app.services.advanced_hunting_analytics_service import advanced_hunting_analytics
 from app.services.free_news_service import free_news_service
 from app.services.accurate_weather_service import accurate_weather_service
-from app.services.real_hunting_spots_service import real_hunting_spots_service
+from app.services.real_hunting_spots_service import get_real_hunting_spots_service
+
+class FrozenDataJSONProvider(DefaultJSONProvider):
+    """JSON provider that also serializes the read-only data views from the services"""
+
+    @staticmethod
+    def default(o):
+        if isinstance(o, MappingProxyType):
+            return dict(o)
+        return DefaultJSONProvider.default(o)
 
 app = Flask(__name__)
+app.json = FrozenDataJSONProvider(app)
 CORS(app)  # Enable CORS for web interface
 
 @app.route('/')
@@ -220,8 +232,8 @@ def get_hunting_forecast():
 def get_hunting_calendar(month):
     """Get hunting calendar for specific month"""
     try:
-        calendar = hunting_data_manager.get_hunting_calendar(month)
-        return jsonify(calendar)
+        calendar_json = hunting_data_manager.get_hunting_calendar_json(month)
+        return Response(calendar_json, mimetype='application/json')
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -231,7 +243,9 @@ def get_hunting_spots():
     try:
         species = request.args.get('species')
         location_type = request.args.get('type')
-        spots = real_hunting_spots_service.get_hunting_spots(species, location_type)
+        if not species and not location_type:
+            return Response(get_real_hunting_spots_service().get_hunting_spots_json(), mimetype='application/json')
+        spots = get_real_hunting_spots_service().get_hunting_spots(species, location_type)
         return jsonify(spots)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -242,7 +256,9 @@ def get_real_hunting_spots():
     try:
         species = request.args.get('species')
         location_type = request.args.get('type')
-        spots = real_hunting_spots_service.get_hunting_spots(species, location_type)
+        if not species and not location_type:
+            return Response(get_real_hunting_spots_service().get_hunting_spots_json(), mimetype='application/json')
+        spots = get_real_hunting_spots_service().get_hunting_spots(species, location_type)
         return jsonify(spots)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -251,8 +267,8 @@ def get_real_hunting_spots():
 def get_harvest_statistics():
     """Get comprehensive harvest statistics"""
     try:
-        stats = real_hunting_spots_service.get_harvest_statistics()
-        return jsonify(stats)
+        stats_json = get_real_hunting_spots_service().get_harvest_statistics_json()
+        return Response(stats_json, mimetype='application/json')
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -260,8 +276,23 @@ def get_harvest_statistics():
 def get_access_points():
     """Get detailed access point information"""
     try:
-        access_points = real_hunting_spots_service.get_access_points()
-        return jsonify(access_points)
+        access_points_json = get_real_hunting_spots_service().get_access_points_json()
+        return Response(access_points_json, mimetype='application/json')
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/nearest-access-points')
+def get_nearest_access_points():
+    """Get the access points closest to a location"""
+    try:
+        lat = request.args.get('lat', type=float)
+        lon = request.args.get('lon', type=float)
+        if lat is None or lon is None:
+            return jsonify({'error': 'lat and lon parameters required'}), 400
+        
+        k = request.args.get('k', 3, type=int)
+        nearest = get_real_hunting_spots_service().nearest_access_points(lat, lon, k)
+        return jsonify({'nearest_access_points': nearest})
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -273,8 +304,12 @@ def search_hunting_spots():
         if not query:
             return jsonify({'error': 'Query parameter required'}), 400
         
-        results = real_hunting_spots_service.search_spots(query)
+        limit = request.args.get('limit', type=int)
+        offset = request.args.get('offset', 0, type=int)
+        results = get_real_hunting_spots_service().search_spots(query, limit, offset)
         return jsonify(results)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 